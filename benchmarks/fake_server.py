@@ -0,0 +1,177 @@
+"""Local stand-in for the Plate Recognizer plate-reader and statistics API.
+
+Usage:
+    python benchmarks/fake_server.py --port 8080 --latency 0.08 --error-rate 0.01
+
+Point `server` at http://127.0.0.1:8080/v1/plate-reader/ to scan without
+spending API quota. Latency, 5xx and 429 rates are configurable so retries,
+failover and the circuit breaker can be exercised.
+"""
+
+import argparse
+import asyncio
+import random
+import string
+import time
+from typing import List, Optional
+
+from aiohttp import web
+
+PLATE_READER_PATH = "/v1/plate-reader/"
+STATISTICS_PATH = "/v1/statistics/"
+
+
+def random_plate(rng: random.Random) -> str:
+    """Return a random plate like 'wx12345'."""
+    letters = "".join(rng.choice(string.ascii_lowercase) for _ in range(2))
+    digits = "".join(rng.choice(string.digits) for _ in range(5))
+    return letters + digits
+
+
+def misread(plate: str, rng: random.Random) -> str:
+    """Return plate with one character replaced, as OCR sometimes does."""
+    position = rng.randrange(len(plate))
+    replacement = rng.choice(string.ascii_lowercase + string.digits)
+    return plate[:position] + replacement + plate[position + 1:]
+
+
+class FakePlateRecognizer:
+    """aiohttp application answering like the plate-reader API."""
+
+    def __init__(
+        self,
+        latency: float = 0.08,
+        jitter: float = 0.02,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        plates: Optional[List[str]] = None,
+        known_rate: float = 0.5,
+        misread_rate: float = 0.1,
+        empty_rate: float = 0.2,
+        max_calls: int = 2500,
+        seed: int = 0,
+    ):
+        """Initialize server behaviour."""
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.plates = plates or []
+        self.known_rate = known_rate
+        self.misread_rate = misread_rate
+        self.empty_rate = empty_rate
+        self.max_calls = max_calls
+        self.calls = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self._rng = random.Random(seed)
+        self._runner = None
+
+    def _result(self) -> dict:
+        """Return one synthetic plate result."""
+        rng = self._rng
+        if self.plates and rng.random() < self.known_rate:
+            plate = rng.choice(self.plates).lower()
+        else:
+            plate = random_plate(rng)
+        read = misread(plate, rng) if rng.random() < self.misread_rate else plate
+        score = round(rng.uniform(0.7, 0.99), 3)
+        xmin, ymin = rng.randrange(0, 1500), rng.randrange(0, 800)
+        return {
+            "box": {"xmin": xmin, "ymin": ymin, "xmax": xmin + 200, "ymax": ymin + 60},
+            "plate": read,
+            "region": {"code": "pl", "score": 0.9},
+            "score": score,
+            "candidates": [
+                {"score": score, "plate": read},
+                {"score": round(score * 0.8, 3), "plate": misread(read, rng)},
+            ],
+            "dscore": 0.9,
+            "vehicle": {"score": 0.9, "type": "Sedan", "box": {"xmin": xmin, "ymin": ymin, "xmax": xmin + 400, "ymax": ymin + 300}},
+        }
+
+    async def handle_plate_reader(self, request: web.Request) -> web.Response:
+        """Answer an upload after the configured latency."""
+        start = time.perf_counter()
+        form = await request.post()
+        rng = self._rng
+        if rng.random() < self.rate_limit_rate:
+            self.rate_limited += 1
+            return web.json_response(
+                {"detail": "Request was throttled."},
+                status=429,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        await asyncio.sleep(max(0.0, rng.gauss(self.latency, self.jitter)))
+        if rng.random() < self.error_rate:
+            self.errors += 1
+            return web.json_response({"detail": "Internal error"}, status=500)
+
+        self.calls += 1
+        results = [] if rng.random() < self.empty_rate else [self._result()]
+        return web.json_response({
+            "processing_time": round((time.perf_counter() - start) * 1000, 1),
+            "results": results,
+            "filename": "upload",
+            "version": 1,
+            "camera_id": form.get("camera_id"),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S.000000Z", time.gmtime()),
+            "usage": {"calls": self.calls, "max_calls": self.max_calls},
+        })
+
+    async def handle_statistics(self, request: web.Request) -> web.Response:
+        """Answer the statistics endpoint."""
+        return web.json_response({
+            "usage": {"month": time.gmtime().tm_mon, "calls": self.calls, "year": time.gmtime().tm_year, "resets_on": None},
+            "total_calls": self.max_calls,
+        })
+
+    def make_app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application(client_max_size=32 * 1024 * 1024)
+        app.router.add_post(PLATE_READER_PATH, self.handle_plate_reader)
+        app.router.add_get(STATISTICS_PATH, self.handle_statistics)
+        return app
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve in the running loop and return the plate-reader URL."""
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        return f"http://{host}:{port}{PLATE_READER_PATH}"
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.08, help="mean answer delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="standard deviation of the delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 500 answers")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of 429 answers")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After of 429 answers")
+    args = parser.parse_args()
+
+    server = FakePlateRecognizer(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+    )
+    print(f"Serving http://{args.host}:{args.port}{PLATE_READER_PATH}")
+    web.run_app(server.make_app(), host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Run the integration outside Home Assistant for benchmarks and replays.
+
+Needs the integration's requirements plus the homeassistant package
+installed, but no running Home Assistant instance.
+"""
+
+import asyncio
+import importlib
+import importlib.util
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+COMPONENT_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "enhanced-platerecognizer"
+PACKAGE = "enhanced_platerecognizer"
+
+
+def load_component(module: str):
+    """Import a module of the integration, whose directory name has a dash."""
+    if PACKAGE not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE,
+            COMPONENT_DIR / "__init__.py",
+            submodule_search_locations=[str(COMPONENT_DIR)],
+        )
+        package = importlib.util.module_from_spec(spec)
+        sys.modules[PACKAGE] = package
+        spec.loader.exec_module(package)
+    return importlib.import_module(f"{PACKAGE}.{module}")
+
+
+class StubEvent:
+    """Event as passed to bus listeners."""
+
+    def __init__(self, event_type: str, data: Dict[str, Any]):
+        import homeassistant.util.dt as dt_util
+
+        self.event_type = event_type
+        self.data = data
+        self.time_fired = dt_util.utcnow()
+
+
+class StubState:
+    """Entity state."""
+
+    def __init__(self, entity_id: str, state: str, attributes: Optional[Dict[str, Any]] = None):
+        self.entity_id = entity_id
+        self.state = state
+        self.attributes = attributes or {}
+
+
+class StubStates:
+    """Minimal state machine."""
+
+    def __init__(self):
+        self._states: Dict[str, StubState] = {}
+
+    def async_set(self, entity_id: str, state: str, attributes=None) -> None:
+        self._states[entity_id] = StubState(entity_id, state, attributes)
+
+    def get(self, entity_id: str) -> Optional[StubState]:
+        return self._states.get(entity_id)
+
+    def async_entity_ids(self, domain: Optional[str] = None) -> List[str]:
+        return [entity_id for entity_id in self._states if domain is None or entity_id.startswith(f"{domain}.")]
+
+
+class StubBus:
+    """Event bus delivering events on the next loop iteration, like Home Assistant."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._listeners: Dict[str, List[Callable]] = {}
+        self.fired: Dict[str, int] = {}
+
+    def async_listen(self, event_type: str, listener: Callable) -> Callable:
+        self._listeners.setdefault(event_type, []).append(listener)
+
+        def remove():
+            self._listeners[event_type].remove(listener)
+
+        return remove
+
+    def async_listen_once(self, event_type: str, listener: Callable) -> Callable:
+        def once(event):
+            remove()
+            return listener(event)
+
+        remove = self.async_listen(event_type, once)
+        return remove
+
+    def async_fire(self, event_type: str, event_data: Optional[Dict[str, Any]] = None) -> None:
+        self.fired[event_type] = self.fired.get(event_type, 0) + 1
+        event = StubEvent(event_type, event_data or {})
+        for listener in list(self._listeners.get(event_type, ())):
+            self._loop.call_soon(self._run, listener, event)
+
+    def fire(self, event_type: str, event_data: Optional[Dict[str, Any]] = None) -> None:
+        self._loop.call_soon_threadsafe(self.async_fire, event_type, event_data)
+
+    def _run(self, listener: Callable, event: StubEvent) -> None:
+        result = listener(event)
+        if asyncio.iscoroutine(result):
+            self._loop.create_task(result)
+
+
+class StubServices:
+    """Service registry; unknown services are recorded and ignored."""
+
+    def __init__(self):
+        self._handlers: Dict[str, Callable] = {}
+        self.calls: List[tuple] = []
+
+    def async_register(self, domain: str, service: str, handler: Callable, schema=None) -> None:
+        self._handlers[f"{domain}.{service}"] = handler
+
+    def has_service(self, domain: str, service: str) -> bool:
+        return f"{domain}.{service}" in self._handlers
+
+    async def async_call(self, domain: str, service: str, data=None, blocking=False) -> None:
+        self.calls.append((domain, service, data))
+        handler = self._handlers.get(f"{domain}.{service}")
+        if handler is not None:
+            await handler(data or {})
+
+
+class StubConfig:
+    """Home Assistant configuration."""
+
+    def __init__(self, config_dir: Path, language: str = "en"):
+        self.config_dir = str(config_dir)
+        self.language = language
+
+    def path(self, *parts: str) -> str:
+        return str(Path(self.config_dir, *parts))
+
+    def is_allowed_path(self, path: str) -> bool:
+        return True
+
+
+class StubHass:
+    """Just enough of HomeAssistant for the recognition pipeline."""
+
+    def __init__(self, config_dir: Path, language: str = "en", executor_workers: int = 8):
+        self.loop = asyncio.get_running_loop()
+        self.data: Dict[str, Any] = {}
+        self.bus = StubBus(self.loop)
+        self.states = StubStates()
+        self.services = StubServices()
+        self.config = StubConfig(config_dir, language)
+        self._executor = ThreadPoolExecutor(executor_workers)
+        self._tasks = set()
+
+    def async_add_executor_job(self, target: Callable, *args) -> asyncio.Future:
+        return self.loop.run_in_executor(self._executor, target, *args)
+
+    def async_create_task(self, coro, name: Optional[str] = None) -> asyncio.Task:
+        task = self.loop.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def async_create_background_task(self, coro, name: str) -> asyncio.Task:
+        return self.async_create_task(coro, name)
+
+    async def async_stop(self) -> None:
+        """Fire stop events, close clients and cancel leftover tasks."""
+        from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, EVENT_HOMEASSISTANT_STOP
+
+        self.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        self.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+        await asyncio.sleep(0.1)
+        for task in list(self._tasks):
+            task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LoopMonitor:
+    """Measure how long the event loop is blocked.
+
+    A task sleeps for a fixed interval; any oversleep is time the loop was
+    busy running something else.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self._interval = interval
+        self._task = None
+        self.lags: List[float] = []
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self._interval)
+            self.lags.append(max(0.0, time.perf_counter() - start - self._interval) * 1000)
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    @property
+    def blocked_ms(self) -> float:
+        """Return total lag above 1 ms, i.e. noticeable blocking."""
+        return sum(lag for lag in self.lags if lag > 1.0)
+
+    @property
+    def max_ms(self) -> float:
+        return max(self.lags, default=0.0)
+
+
+def describe(samples: List[float]) -> str:
+    """Return 'p50/p95/p99 ms' of samples."""
+    if not samples:
+        return "-"
+    percentile = load_component("latency").percentile
+    ordered = sorted(samples)
+    return "/".join(f"{percentile(ordered, pct):.1f}" for pct in (50, 95, 99))
@@ -0,0 +1,263 @@
+"""Benchmark the recognition pipeline against a local fake Plate Recognizer server.
+
+Usage:
+    python benchmarks/pipeline_benchmark.py [scenario ...] [--duration 10]
+
+Scenarios:
+    cameras   20 cameras at 2 fps against a 10k plate registry
+    faults    as cameras, with 5% server errors and 5% rate limited answers
+    burst     5 cameras scanning vehicle passages with consecutive captures and consensus
+    registry  build and query registries of 10k, 100k and 1M plates
+
+Each scenario reports scans/sec, end-to-end latency (scan start until the
+image processed event was handled) as p50/p95/p99, event loop blocking and
+memory. Needs the integration's requirements and the homeassistant package;
+no API quota is used.
+"""
+
+import argparse
+import asyncio
+import io
+import random
+import resource
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+from fake_server import FakePlateRecognizer, misread, random_plate
+from harness import LoopMonitor, StubHass, describe, load_component
+
+EVENT_IMAGE_PROCESSED = "enhanced_platerecognizer_image_processed"
+
+SCENARIOS = {
+    "cameras": {"cameras": 20, "fps": 2.0, "registry": 10_000},
+    "faults": {"cameras": 20, "fps": 2.0, "registry": 10_000, "error_rate": 0.05, "rate_limit_rate": 0.05},
+    "burst": {"cameras": 5, "fps": 0.5, "registry": 10_000, "burst": True},
+    "registry": {"sizes": [10_000, 100_000, 1_000_000]},
+}
+
+
+def make_frames(count: int, width: int, height: int, seed: int = 0) -> List[bytes]:
+    """Return distinct synthetic JPEG camera frames."""
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(seed)
+    frames = []
+    for _ in range(count):
+        image = Image.new("RGB", (width, height), (rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+        draw = ImageDraw.Draw(image)
+        for _ in range(40):
+            x, y = rng.randrange(width), rng.randrange(height)
+            colour = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            draw.rectangle((x, y, x + rng.randrange(20, 300), y + rng.randrange(20, 200)), fill=colour)
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", quality=85)
+        frames.append(buffer.getvalue())
+    return frames
+
+
+def make_registry(size: int, seed: int = 1) -> Dict[str, str]:
+    """Return a registry of size random plates."""
+    rng = random.Random(seed)
+    registry = {}
+    while len(registry) < size:
+        registry[random_plate(rng).upper()] = f"Owner {len(registry)}"
+    return registry
+
+
+def peak_rss_mb() -> float:
+    """Return peak resident memory of the process in MB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def async_setup(hass: StubHass, url: str, cameras: int, registry: Dict[str, str], options: dict):
+    """Set up the platform like Home Assistant would and return its entities."""
+    image_processing = load_component("image_processing")
+    plate_manager_module = load_component("plate_manager")
+
+    plate_manager = plate_manager_module.PlateManager(hass, {})
+    plate_manager._set_known_plates(registry)
+    hass.data.setdefault("enhanced_platerecognizer", {})["plate_manager"] = plate_manager
+
+    config = image_processing.PLATFORM_SCHEMA({
+        "platform": "enhanced_platerecognizer",
+        "api_token": "benchmark",
+        "server": url,
+        "source": [{"entity_id": f"camera.bench_{n}"} for n in range(cameras)],
+        **options,
+    })
+    entities = []
+    await image_processing.async_setup_platform(hass, config, entities.extend)
+    for entity in entities:
+        entity.entity_id = f"image_processing.{entity.name}"
+    return entities, plate_manager
+
+
+async def run_pipeline(name: str, scenario: dict, args) -> None:
+    """Run a camera scenario and print its report."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = StubHass(Path(config_dir))
+        registry = make_registry(scenario["registry"])
+        server = FakePlateRecognizer(
+            latency=args.latency,
+            error_rate=scenario.get("error_rate", args.error_rate),
+            rate_limit_rate=scenario.get("rate_limit_rate", args.rate_limit_rate),
+            plates=list(registry),
+        )
+        url = await server.async_start()
+        frames = await hass.async_add_executor_job(make_frames, args.frames, args.width, args.height)
+
+        options = {"max_concurrent_uploads": args.concurrency}
+        if scenario.get("burst"):
+            options.update({"consecutive_captures": True, "consensus": True})
+        entities, plate_manager = await async_setup(hass, url, scenario["cameras"], registry, options)
+        by_id = {entity.entity_id: entity for entity in entities}
+
+        started: Dict[str, float] = {}
+        latencies: List[float] = []
+        known = 0
+
+        def handle_image_processed(event):
+            # Same work the recognized car sensor does for each event
+            nonlocal known
+            for vehicle in event.data.get("vehicles", []):
+                known += plate_manager.match(vehicle["plate"]).known
+            start = started.get(event.data["entity_id"])
+            if start is not None:
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        hass.bus.async_listen(EVENT_IMAGE_PROCESSED, handle_image_processed)
+
+        async def handle_scan(data):
+            # Burst follow-up scans re-trigger the entity with the next frame
+            entity = by_id[data["entity_id"]]
+            await entity.async_process_image(random.choice(frames))
+
+        hass.services.async_register("image_processing", "scan", handle_scan)
+
+        scans = 0
+        skipped = 0
+
+        async def camera_loop(entity):
+            nonlocal scans, skipped
+            period = 1 / scenario["fps"]
+            next_at = time.perf_counter() + random.uniform(0, period)
+            running = None
+            while True:
+                await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+                next_at += period
+                if running is not None and not running.done():
+                    skipped += 1  # Previous scan still running, frame dropped
+                    continue
+                started[entity.entity_id] = time.perf_counter()
+                scans += 1
+                running = hass.async_create_task(entity.async_process_image(random.choice(frames)))
+
+        if args.tracemalloc:
+            tracemalloc.start()
+        monitor = LoopMonitor()
+        monitor.start()
+        start = time.perf_counter()
+        loops = [hass.async_create_task(camera_loop(entity)) for entity in entities]
+        await asyncio.sleep(args.duration)
+        for loop in loops:
+            loop.cancel()
+        elapsed = time.perf_counter() - start
+        monitor.stop()
+        memory = tracemalloc.get_traced_memory()[1] / 2**20 if args.tracemalloc else peak_rss_mb()
+        if args.tracemalloc:
+            tracemalloc.stop()
+
+        scheduler = hass.data["enhanced_platerecognizer"]["scheduler"].stats
+        await hass.async_stop()
+        await server.async_stop()
+
+    print(f"\n== {name}: {scenario['cameras']} cameras at {scenario['fps']} fps, {len(registry)} plates, {elapsed:.1f} s")
+    print(f"scans started       {scans} ({scans / elapsed:.1f}/s), frames dropped {skipped}")
+    print(f"events handled      {len(latencies)} ({len(latencies) / elapsed:.1f}/s), known plates {known}")
+    print(f"end-to-end ms       {describe(latencies)} (p50/p95/p99)")
+    print(f"scheduler wait ms   avg {scheduler['avg_wait_ms']}, max {scheduler['max_wait_ms']}, rate limited {scheduler['rate_limited']}")
+    print(f"server              {server.calls} answers, {server.errors} errors, {server.rate_limited} rate limited")
+    print(f"event loop          blocked {monitor.blocked_ms:.0f} ms, max lag {monitor.max_ms:.1f} ms")
+    print(f"memory              {memory:.0f} MB {'traced peak' if args.tracemalloc else 'peak RSS'}")
+
+
+async def run_registry(name: str, scenario: dict, args) -> None:
+    """Build registries of growing size and time lookups."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = StubHass(Path(config_dir))
+        plate_manager_module = load_component("plate_manager")
+        rng = random.Random(2)
+        print(f"\n== {name}")
+        print(f"{'plates':>10}{'build s':>10}{'index MB':>10}{'matches/s':>12}{'match us p50/p95/p99':>26}{'batch/s':>12}")
+        for size in scenario["sizes"]:
+            registry = make_registry(size)
+            plates = list(registry)
+            queries = []
+            for _ in range(args.queries):
+                choice = rng.random()
+                if choice < 0.4:
+                    queries.append(rng.choice(plates))
+                elif choice < 0.7:
+                    queries.append(misread(rng.choice(plates), rng).upper())
+                else:
+                    queries.append(random_plate(rng).upper())
+
+            plate_manager = plate_manager_module.PlateManager(hass, {})
+            tracemalloc.start()
+            start = time.perf_counter()
+            plate_manager._set_known_plates(registry)
+            build = time.perf_counter() - start
+            index_mb = tracemalloc.get_traced_memory()[0] / 2**20
+            tracemalloc.stop()
+
+            timings = []
+            start = time.perf_counter()
+            for query in queries:
+                query_start = time.perf_counter()
+                plate_manager.match(query)
+                timings.append((time.perf_counter() - query_start) * 1e6)
+            elapsed = time.perf_counter() - start
+
+            # Batch path; the first call also builds the matrix
+            plate_manager.match_many(queries[:1])
+            start = time.perf_counter()
+            plate_manager.match_many(queries)
+            batch = time.perf_counter() - start
+            print(
+                f"{size:>10}{build:>10.2f}{index_mb:>10.0f}{len(queries) / elapsed:>12.0f}"
+                f"{describe(timings):>26}{len(queries) / batch:>12.0f}"
+            )
+        await hass.async_stop()
+
+
+async def main_async(args) -> None:
+    for name in args.scenarios:
+        scenario = SCENARIOS[name]
+        if "sizes" in scenario:
+            await run_registry(name, scenario, args)
+        else:
+            await run_pipeline(name, scenario, args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", choices=list(SCENARIOS), default=["cameras", "faults", "burst", "registry"])
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per camera scenario")
+    parser.add_argument("--latency", type=float, default=0.08, help="mean fake server answer delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 500 answers")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of 429 answers")
+    parser.add_argument("--concurrency", type=int, default=4, help="max_concurrent_uploads")
+    parser.add_argument("--frames", type=int, default=8, help="distinct synthetic frames")
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--queries", type=int, default=10_000, help="lookups per registry size")
+    parser.add_argument("--tracemalloc", action="store_true", help="report traced instead of RSS memory (slower)")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark pre-upload image preprocessing settings.
+
+Usage:
+    python benchmarks/preprocess_benchmark.py snapshot1.jpg [snapshot2.jpg ...]
+
+For every setting prints the average number of bytes that would be uploaded
+and the average preprocessing time per frame.
+"""
+
+import argparse
+import importlib.util
+import statistics
+import time
+from pathlib import Path
+
+COMPONENT_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "enhanced-platerecognizer"
+
+SETTINGS = [
+    ("original", {}),
+    ("jpeg q85", {"jpeg_quality": 85}),
+    ("jpeg q70", {"jpeg_quality": 70}),
+    ("edge 1920", {"max_edge": 1920}),
+    ("edge 1280", {"max_edge": 1280}),
+    ("edge 1280 q70", {"max_edge": 1280, "jpeg_quality": 70}),
+    ("edge 1280 grey q70", {"max_edge": 1280, "greyscale": True, "jpeg_quality": 70}),
+    ("edge 960 grey q70", {"max_edge": 960, "greyscale": True, "jpeg_quality": 70}),
+]
+
+
+def load_preprocessing():
+    """Load image_preprocessing without importing Home Assistant."""
+    spec = importlib.util.spec_from_file_location(
+        "image_preprocessing", COMPONENT_DIR / "image_preprocessing.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("images", nargs="+", type=Path, help="camera snapshots to benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per image and setting")
+    args = parser.parse_args()
+
+    preprocessing = load_preprocessing()
+    frames = [path.read_bytes() for path in args.images]
+
+    print(f"{'setting':<22}{'bytes':>12}{'ratio':>8}{'encode ms':>12}")
+    baseline = statistics.mean(len(frame) for frame in frames)
+    for name, options in SETTINGS:
+        sizes, timings = [], []
+        for frame in frames:
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                prepared = preprocessing.preprocess_image(frame, **options)
+                timings.append((time.perf_counter() - start) * 1000)
+                sizes.append(len(prepared.data))
+        size = statistics.mean(sizes)
+        print(f"{name:<22}{size:>12.0f}{size / baseline:>8.2f}{statistics.mean(timings):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Replay stored snapshots through the recognition pipeline from the command line.
+
+Usage:
+    python benchmarks/replay_snapshots.py /media/image/platerecognizer \
+        --api-token TOKEN --plates /config/plates.yaml --output replay.jsonl
+
+Runs outside Home Assistant with the same preprocessing, backend, result
+cache, parsing and registry matching as the `enhanced_platerecognizer.replay`
+service. Use --server with benchmarks/fake_server.py to replay without
+spending API quota. Writes one JSON line per snapshot and prints the
+aggregate accuracy and throughput.
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+
+import yaml
+
+from harness import StubHass, load_component
+
+# Registers the integration package in spawned preprocessing workers too
+load_component("image_preprocessing")
+
+
+async def main_async(args) -> None:
+    image_processing = load_component("image_processing")
+    plate_manager_module = load_component("plate_manager")
+    replay = load_component("replay")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = StubHass(Path(config_dir))
+
+        plates = {}
+        if args.plates:
+            plates = (yaml.safe_load(args.plates.read_text(encoding="utf-8")) or {}).get("plates", {})
+        plate_manager = plate_manager_module.PlateManager(
+            hass, {"tolerate_one_mistake": not args.no_tolerate}
+        )
+        plate_manager._set_known_plates(plates)
+        hass.data.setdefault("enhanced_platerecognizer", {})["plate_manager"] = plate_manager
+
+        options = json.loads(args.options) if args.options else {}
+        if args.consensus:
+            options.update({"consecutive_captures": True, "consensus": True})
+        config = image_processing.PLATFORM_SCHEMA({
+            "platform": "enhanced_platerecognizer",
+            "api_token": args.api_token,
+            "server": args.server,
+            "source": [{"entity_id": "camera.replay", "name": "platerecognizer_replay"}],
+            **options,
+        })
+        entities = []
+        await image_processing.async_setup_platform(hass, config, entities.extend)
+        entity = entities[0]
+        entity.entity_id = "image_processing.platerecognizer_replay"
+
+        try:
+            summary = await replay.async_replay(
+                hass,
+                entity,
+                args.folder,
+                args.output,
+                args.workers,
+                args.labels,
+                args.limit,
+                args.passage_gap,
+            )
+        finally:
+            await hass.async_stop()
+
+    print(json.dumps(summary, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("folder", type=Path, help="folder with stored snapshots")
+    parser.add_argument("--api-token", default="replay")
+    parser.add_argument("--server", default="https://api.platerecognizer.com/v1/plate-reader/")
+    parser.add_argument("--plates", type=Path, help="plates.yaml registry to match against")
+    parser.add_argument("--no-tolerate", action="store_true", help="disable tolerate_one_mistake")
+    parser.add_argument("--consensus", action="store_true", help="also fuse snapshots of each passage")
+    parser.add_argument("--passage-gap", type=float, default=5.0, help="seconds separating passages")
+    parser.add_argument("--options", help="further platform options as JSON, e.g. '{\"max_image_edge\": 1280}'")
+    parser.add_argument("--output", type=Path, default=Path("replay.jsonl"))
+    parser.add_argument("--workers", type=int, default=4, help="preprocessing processes")
+    parser.add_argument("--labels", type=Path, help="JSON mapping file names to expected plates")
+    parser.add_argument("--limit", type=int)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ from homeassistant.const import Platform
 from homeassistant.helpers import discovery
 
 from .plate_manager import PlateManager
+from .plate_io import async_setup_plate_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +28,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         plate_manager = PlateManager(hass, domain_config)
         hass.data[DOMAIN]["plate_manager"] = plate_manager
         _LOGGER.info("PlateManager has been successfully registered in hass.data")
+        async_setup_plate_services(hass, plate_manager)
     except Exception as e:
         _LOGGER.error(f"Error during PlateManager initialization: {e}")
         return False
@@ -0,0 +1,110 @@
+"""Pooled asynchronous HTTP client for Plate Recognizer servers."""
+
+import asyncio
+import logging
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "enhanced_platerecognizer"
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 10.0
+DEFAULT_RETRY_AFTER = 1.0  # seconds, when a 429 carries no Retry-After
+
+
+class RateLimitedError(Exception):
+    """Server answered 429 Too Many Requests."""
+
+    def __init__(self, retry_after: float):
+        """Initialize error."""
+        super().__init__(f"Rate limited, retry after {retry_after:.1f} s")
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> float:
+    """Return seconds to wait from a Retry-After header (seconds or HTTP date)."""
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+    return max(0.0, (retry_at - dt_util.utcnow()).total_seconds())
+
+
+class PlateRecognizerClient:
+    """Keep-alive HTTP session shared by all entities using one server.
+
+    The session comes from Home Assistant, which adds its default headers
+    and closes it on shutdown. Its connector is shared by the whole
+    instance, so pool_size is enforced by limiting concurrent uploads,
+    which bounds the keep-alive connections opened to the server.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        server: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ):
+        """Initialize client."""
+        self.hass = hass
+        self.server = server
+        self._pool = asyncio.Semaphore(pool_size)
+        self._timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=connect_timeout, sock_read=read_timeout
+        )
+        self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use."""
+        if self._session is None:
+            self._session = async_create_clientsession(self.hass, timeout=self._timeout)
+        return self._session
+
+    async def async_post_image(
+        self, image, fields: List[Tuple[str, str]], headers: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Upload image with prebuilt form fields and return decoded JSON."""
+        form = aiohttp.FormData(fields)
+        form.add_field("upload", image, filename="upload", content_type="application/octet-stream")
+        async with self._pool:
+            async with self.session.post(self.server, data=form, headers=headers) as response:
+                if response.status == 429:
+                    raise RateLimitedError(parse_retry_after(response.headers.get("Retry-After")))
+                response.raise_for_status()
+                return await response.json(content_type=None)
+
+
+@callback
+def async_get_client(
+    hass: HomeAssistant,
+    server: str,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    read_timeout: float = DEFAULT_READ_TIMEOUT,
+) -> PlateRecognizerClient:
+    """Return the shared client for server, creating it on first use."""
+    clients = hass.data.setdefault(DOMAIN, {}).setdefault("clients", {})
+    client = clients.get(server)
+    if client is None:
+        _LOGGER.debug(f"Creating HTTP client for {server} with pool size {pool_size}")
+        client = PlateRecognizerClient(hass, server, pool_size, connect_timeout, read_timeout)
+        clients[server] = client
+    return client
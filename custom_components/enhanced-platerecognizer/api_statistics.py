@@ -0,0 +1,141 @@
+"""Shared API usage statistics for Plate Recognizer tokens."""
+
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "enhanced_platerecognizer"
+
+STATS_URL = "https://api.platerecognizer.com/v1/statistics/"
+
+DEFAULT_STATISTICS_INTERVAL = 600  # seconds
+STATISTICS_TIMEOUT = 10  # seconds
+
+
+class StatisticsService:
+    """Cached usage statistics shared by all entities using one API token.
+
+    The snapshot is refreshed from the statistics endpoint on a background
+    interval and updated in between from plate-reader responses, so scans
+    never wait for a statistics call.
+    """
+
+    def __init__(self, hass: HomeAssistant, api_token: str, ttl: timedelta):
+        """Initialize service."""
+        self.hass = hass
+        self._headers = {"Authorization": f"Token {api_token}"}
+        self._ttl = ttl
+        self._snapshot: Dict[str, Any] = {}
+        self._last_refresh = None
+        self._refresh_lock = asyncio.Lock()
+        self._unsub_interval = None
+
+    @property
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a copy of the cached statistics."""
+        return self._snapshot.copy()
+
+    @property
+    def is_fresh(self) -> bool:
+        """Return True if the snapshot is younger than its TTL."""
+        return (
+            self._last_refresh is not None
+            and dt_util.utcnow() - self._last_refresh < self._ttl
+        )
+
+    @callback
+    def async_start_polling(self) -> None:
+        """Start background refreshes from the statistics endpoint."""
+        if self._unsub_interval is not None:
+            return
+        self._unsub_interval = async_track_time_interval(
+            self.hass, self._async_interval_refresh, self._ttl
+        )
+        self.hass.async_create_task(self.async_refresh())
+
+    @callback
+    def async_stop_polling(self, event=None) -> None:
+        """Stop background refreshes."""
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+
+    async def _async_interval_refresh(self, now) -> None:
+        """Refresh on interval."""
+        await self.async_refresh()
+
+    async def async_refresh(self, force: bool = False) -> None:
+        """Fetch statistics unless the snapshot is still fresh."""
+        async with self._refresh_lock:
+            if self.is_fresh and not force:
+                return
+            session = async_get_clientsession(self.hass)
+            try:
+                async with session.get(
+                    STATS_URL,
+                    headers=self._headers,
+                    timeout=aiohttp.ClientTimeout(total=STATISTICS_TIMEOUT),
+                ) as response:
+                    response.raise_for_status()
+                    stats = await response.json(content_type=None)
+                calls_remaining = stats["total_calls"] - stats["usage"]["calls"]
+                stats.update({"calls_remaining": calls_remaining})
+                self._snapshot = stats
+                self._last_refresh = dt_util.utcnow()
+            except Exception as exc:
+                _LOGGER.error("platerecognizer error getting statistics: %s", exc)
+
+    @callback
+    def async_update_from_usage(self, usage: Dict[str, Any]) -> None:
+        """Update snapshot from the usage block of a plate-reader response."""
+        if "total_calls" in self._snapshot and "calls" in usage:
+            # Statistics endpoint layout: keep it, only move the counters
+            snapshot = self.snapshot
+            snapshot["usage"] = {**snapshot.get("usage", {}), "calls": usage["calls"]}
+            if "max_calls" in usage:
+                snapshot["total_calls"] = usage["max_calls"]
+            snapshot["calls_remaining"] = snapshot["total_calls"] - usage["calls"]
+        else:
+            snapshot = dict(usage)
+            calls_remaining = snapshot.get("max_calls", 0) - snapshot.get("calls", 0)
+            snapshot.update({"calls_remaining": calls_remaining})
+        self._snapshot = snapshot
+
+    @callback
+    def async_record_call(self) -> None:
+        """Count one plate-reader call against the cached snapshot."""
+        if "total_calls" not in self._snapshot:
+            return
+        snapshot = self.snapshot
+        usage = {**snapshot.get("usage", {})}
+        usage["calls"] = usage.get("calls", 0) + 1
+        snapshot["usage"] = usage
+        snapshot["calls_remaining"] = snapshot["total_calls"] - usage["calls"]
+        self._snapshot = snapshot
+
+
+@callback
+def async_get_statistics_service(
+    hass: HomeAssistant,
+    api_token: str,
+    interval: int = DEFAULT_STATISTICS_INTERVAL,
+) -> StatisticsService:
+    """Return the shared statistics service for api_token."""
+    services = hass.data.setdefault(DOMAIN, {}).setdefault("statistics", {})
+    service: Optional[StatisticsService] = services.get(api_token)
+    if service is None:
+        service = StatisticsService(hass, api_token, timedelta(seconds=interval))
+        services[api_token] = service
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, service.async_stop_polling)
+    return service
@@ -0,0 +1,194 @@
+"""Pool of recognition backends with latency-based routing and failover."""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api_client import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_READ_TIMEOUT,
+    PlateRecognizerClient,
+    RateLimitedError,
+    async_get_client,
+)
+from .circuit_breaker import (
+    DEFAULT_BACKOFF,
+    DEFAULT_FAILURE_THRESHOLD,
+    CircuitBreaker,
+    CircuitOpenError,
+    async_get_breaker,
+    is_server_failure,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "enhanced_platerecognizer"
+
+CONF_URL = "url"
+CONF_WEIGHT = "weight"
+CONF_FALLBACK = "fallback"
+
+EWMA_ALPHA = 0.3  # weight of the newest response time
+
+
+class Backend:
+    """One recognition server and its observed response times.
+
+    Shared by all pools that list the same URL, so every camera routes on
+    the same measurements.
+    """
+
+    def __init__(self, url: str, client: PlateRecognizerClient, breaker: CircuitBreaker):
+        """Initialize backend."""
+        self.url = url
+        self.client = client
+        self.breaker = breaker
+        self.ewma_ms: Optional[float] = None
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.usage: Optional[Dict[str, Any]] = None
+
+    def record_latency(self, elapsed_ms: float) -> None:
+        """Fold a response time into the moving average."""
+        if self.ewma_ms is None:
+            self.ewma_ms = elapsed_ms
+        else:
+            self.ewma_ms += EWMA_ALPHA * (elapsed_ms - self.ewma_ms)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return backend attributes."""
+        return {
+            "url": self.url,
+            "state": self.breaker.state,
+            "ewma_ms": round(self.ewma_ms, 1) if self.ewma_ms is not None else None,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "failures": self.failures,
+        }
+
+
+class BackendPool:
+    """Route uploads to the fastest healthy backend and fail over on errors.
+
+    Backends are ranked by moving-average response time times the uploads
+    already running on them, divided by their weight, so local containers
+    share the load. Unmeasured backends are tried first, ties keep list
+    order. Fallback backends are only used when no primary one answered.
+    """
+
+    def __init__(self, entries: List[Tuple[Backend, float, bool]]):
+        """Initialize pool from (backend, weight, fallback) entries."""
+        self._entries = entries
+
+    @property
+    def backends(self) -> List[Backend]:
+        """Return backends in configured order."""
+        return [backend for backend, _, _ in self._entries]
+
+    @property
+    def is_open(self) -> bool:
+        """Return True if every backend is failing fast."""
+        return all(backend.breaker.is_open for backend in self.backends)
+
+    def _ranked(self) -> List[Backend]:
+        """Return backends in the order they should be tried."""
+        def score(item):
+            position, (backend, weight, fallback) = item
+            latency = backend.ewma_ms or 0.0
+            return (fallback, latency * (backend.in_flight + 1) / weight, position)
+
+        return [entry[0] for _, entry in sorted(enumerate(self._entries), key=score)]
+
+    async def async_post_image(self, image, fields, headers) -> Tuple[Backend, Dict[str, Any]]:
+        """Upload image and return (answering backend, decoded JSON)."""
+        last_error: Optional[Exception] = None
+        for backend in self._ranked():
+            if backend.breaker.is_open:
+                continue
+            backend.in_flight += 1
+            backend.requests += 1
+            start = time.monotonic()
+            try:
+                response = await backend.breaker.async_call(
+                    lambda: backend.client.async_post_image(image, fields, headers)
+                )
+            except (CircuitOpenError, RateLimitedError) as err:
+                last_error = err
+            except Exception as err:
+                if not is_server_failure(err):
+                    raise
+                backend.failures += 1
+                last_error = err
+                _LOGGER.warning(f"Backend {backend.url} failed, trying next: {err}")
+            else:
+                backend.record_latency((time.monotonic() - start) * 1000)
+                if "usage" in response:
+                    backend.usage = response["usage"]
+                return backend, response
+            finally:
+                backend.in_flight -= 1
+
+        if last_error is None:
+            raise CircuitOpenError("All recognition backends are unavailable")
+        raise last_error
+
+    @property
+    def stats(self) -> List[Dict[str, Any]]:
+        """Return per-backend attributes."""
+        result = []
+        for backend, weight, fallback in self._entries:
+            stats = backend.stats
+            stats[CONF_WEIGHT] = weight
+            if fallback:
+                stats[CONF_FALLBACK] = True
+            if backend.usage is not None:
+                stats["usage"] = backend.usage
+            result.append(stats)
+        return result
+
+
+def normalize_backends(value) -> List[Dict[str, Any]]:
+    """Return backend entries from a URL or a list of URLs and mappings."""
+    if isinstance(value, str):
+        value = [value]
+    entries = []
+    for item in value:
+        if isinstance(item, str):
+            item = {CONF_URL: item}
+        entries.append({
+            CONF_URL: item[CONF_URL],
+            CONF_WEIGHT: float(item.get(CONF_WEIGHT, 1.0)),
+            CONF_FALLBACK: bool(item.get(CONF_FALLBACK, False)),
+        })
+    return entries
+
+
+@callback
+def async_get_backend_pool(
+    hass: HomeAssistant,
+    entries: List[Dict[str, Any]],
+    pool_size: int = DEFAULT_POOL_SIZE,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    read_timeout: float = DEFAULT_READ_TIMEOUT,
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    backoff: float = DEFAULT_BACKOFF,
+) -> BackendPool:
+    """Return a pool over the shared backends for entries."""
+    backends = hass.data.setdefault(DOMAIN, {}).setdefault("backends", {})
+    pool_entries = []
+    for entry in entries:
+        url = entry[CONF_URL]
+        backend = backends.get(url)
+        if backend is None:
+            backend = backends[url] = Backend(
+                url,
+                async_get_client(hass, url, pool_size, connect_timeout, read_timeout),
+                async_get_breaker(hass, url, failure_threshold, backoff),
+            )
+        pool_entries.append((backend, entry[CONF_WEIGHT], entry[CONF_FALLBACK]))
+    return BackendPool(pool_entries)
@@ -0,0 +1,157 @@
+"""Quota-aware scan budgeting driven by API statistics."""
+
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
+
+from .api_statistics import StatisticsService
+
+DOMAIN = "enhanced_platerecognizer"
+
+DEFAULT_BUDGET_RESERVE = 0.1  # share of the quota kept for high-priority scans
+BUDGET_BURST = 5  # scans that may run back to back on saved-up budget
+
+
+class BudgetExceededError(Exception):
+    """Scan skipped to stay within the API quota."""
+
+
+def _add_month(moment: datetime) -> datetime:
+    """Return first day of the month after moment."""
+    return (moment.replace(day=1) + timedelta(days=32)).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def _subtract_month(moment: datetime) -> datetime:
+    """Return same day one month earlier, clamped to the month length."""
+    previous = moment.replace(day=1) - timedelta(days=1)
+    return moment.replace(year=previous.year, month=previous.month, day=min(moment.day, previous.day))
+
+
+class ScanBudget:
+    """Spread the remaining API calls over the rest of the billing period.
+
+    Calls remaining divided by time left gives the sustainable scan rate.
+    High-priority scans always run while quota is left and are charged
+    against that rate; low-priority scans (burst follow-ups, low-priority
+    cameras) only run when the rate has budget to spare and the reserve
+    is untouched.
+    """
+
+    def __init__(self, statistics: StatisticsService, reserve: float = DEFAULT_BUDGET_RESERVE):
+        """Initialize budget."""
+        self._statistics = statistics
+        self._reserve = reserve
+        self._allowance = float(BUDGET_BURST)
+        self._updated = time.monotonic()
+        self.throttled_high = 0
+        self.throttled_low = 0
+
+    def _quota(self, snapshot: Dict[str, Any]) -> Tuple[Optional[int], Optional[int]]:
+        """Return (calls remaining, calls per period) from statistics."""
+        total = snapshot.get("total_calls", snapshot.get("max_calls"))
+        return snapshot.get("calls_remaining"), total
+
+    def _period(self, snapshot: Dict[str, Any], now: datetime) -> Tuple[datetime, datetime, bool]:
+        """Return (start, end, statistics belong to it) of the billing period."""
+        resets_on = snapshot.get("usage", {}).get("resets_on")
+        end = dt_util.parse_datetime(resets_on) if resets_on else None
+        if end is not None:
+            # resets_on may come without an offset; the API reports UTC
+            if end.tzinfo is None:
+                end = end.replace(tzinfo=dt_util.UTC)
+            end = dt_util.as_utc(end)
+        if end is not None and end > now:
+            return _subtract_month(end), end, True
+        start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        return start, _add_month(now), end is None
+
+    def allowed_rate(self) -> Optional[float]:
+        """Return sustainable scans per second, None without statistics."""
+        snapshot = self._statistics.snapshot
+        remaining, _ = self._quota(snapshot)
+        if remaining is None:
+            return None
+        now = dt_util.utcnow()
+        _, end, _ = self._period(snapshot, now)
+        return max(0, remaining) / max(1.0, (end - now).total_seconds())
+
+    def allow(self, low_priority: bool) -> bool:
+        """Return True if a scan may use an API call now."""
+        snapshot = self._statistics.snapshot
+        remaining, total = self._quota(snapshot)
+        if remaining is None:
+            return True
+
+        now = dt_util.utcnow()
+        _, end, current = self._period(snapshot, now)
+        if remaining <= 0 and current:
+            if low_priority:
+                self.throttled_low += 1
+            else:
+                self.throttled_high += 1
+            return False
+
+        rate = max(0, remaining) / max(1.0, (end - now).total_seconds())
+        mono = time.monotonic()
+        self._allowance = min(BUDGET_BURST, self._allowance + (mono - self._updated) * rate)
+        self._updated = mono
+
+        if not low_priority:
+            self._allowance -= 1
+            return True
+
+        if (total and remaining <= total * self._reserve) or self._allowance < 1:
+            self.throttled_low += 1
+            return False
+        self._allowance -= 1
+        return True
+
+    def projected_exhaustion(self) -> Optional[datetime]:
+        """Return when the quota runs out at the current period's usage rate."""
+        snapshot = self._statistics.snapshot
+        remaining, total = self._quota(snapshot)
+        if remaining is None or not total:
+            return None
+        now = dt_util.utcnow()
+        start, _, _ = self._period(snapshot, now)
+        used = total - remaining
+        elapsed = (now - start).total_seconds()
+        if used <= 0 or elapsed <= 0:
+            return None
+        return now + timedelta(seconds=max(0, remaining) * elapsed / used)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return budget attributes."""
+        rate = self.allowed_rate()
+        exhaustion = self.projected_exhaustion()
+        snapshot = self._statistics.snapshot
+        _, end, _ = self._period(snapshot, dt_util.utcnow())
+        return {
+            "allowed_scans_per_hour": round(rate * 3600, 1) if rate is not None else None,
+            "period_end": end.isoformat(),
+            "projected_exhaustion": exhaustion.isoformat() if exhaustion else None,
+            "exhausts_before_reset": exhaustion is not None and exhaustion < end,
+            "throttled_high_priority": self.throttled_high,
+            "throttled_low_priority": self.throttled_low,
+        }
+
+
+@callback
+def async_get_budget(
+    hass: HomeAssistant,
+    api_token: str,
+    statistics: StatisticsService,
+    reserve: float = DEFAULT_BUDGET_RESERVE,
+) -> ScanBudget:
+    """Return the shared budget for api_token."""
+    budgets = hass.data.setdefault(DOMAIN, {}).setdefault("budgets", {})
+    budget = budgets.get(api_token)
+    if budget is None:
+        budget = budgets[api_token] = ScanBudget(statistics, reserve)
+    return budget
@@ -0,0 +1,111 @@
+"""Consecutive-capture burst sessions."""
+
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+DEFAULT_BURST_CONFIDENCE = 0.9
+DEFAULT_BURST_AGREEMENT = 2
+
+# Vehicle not in frame yet: give it time to drive in
+NO_VEHICLE_DELAY_FACTOR = 1.5
+# Plate read with low confidence: vehicle is there, try another frame soon
+LOW_CONFIDENCE_DELAY_FACTOR = 0.5
+# Session whose follow-up scan never arrived (e.g. camera unavailable)
+STALE_AFTER = 10  # seconds
+
+
+class BurstSession:
+    """Follow-up scans for one vehicle passage.
+
+    Every scan made while the session is open - scheduled follow-ups and
+    overlapping triggers alike - is recorded here, so a passage costs one
+    session no matter how many triggers fire. The session stops early once a
+    plate is read with enough confidence or enough frames agree on it.
+    """
+
+    def __init__(
+        self,
+        max_scans: int,
+        base_delay: float,
+        confidence_threshold: float = DEFAULT_BURST_CONFIDENCE,
+        agreement: int = DEFAULT_BURST_AGREEMENT,
+    ):
+        """Initialize session."""
+        self._max_scans = max_scans
+        self._base_delay = base_delay
+        self._confidence_threshold = confidence_threshold
+        self._agreement = agreement
+        self._votes: Counter = Counter()
+        self.frames: List[List[Dict]] = []
+        self.results: List[List[Dict]] = []
+        self.reported = False
+        self.stopped_early = False
+        # Set once the session has been reported without its follow-up scan
+        self.stale = False
+        self.task = None
+        # Cancels the timer that reports the session once it goes stale
+        self.unsub_stale = None
+        self._last_scan = time.monotonic()
+
+    @property
+    def scans(self) -> int:
+        """Return number of recorded scans."""
+        return len(self.frames)
+
+    @property
+    def done(self) -> bool:
+        """Return True if no more scans are needed."""
+        return (
+            self.stopped_early
+            or self.stale
+            or self.scans >= self._max_scans
+            or time.monotonic() - self._last_scan > STALE_AFTER
+        )
+
+    def record(self, vehicles: List[Dict], results: Optional[List[Dict]] = None) -> None:
+        """Record vehicles of one scan and decide whether to stop early."""
+        self.frames.append(vehicles)
+        self.results.append(results or [])
+        self._last_scan = time.monotonic()
+        # A candidate that matched the registry outvotes a misread top plate
+        plates = {
+            (vehicle.get("candidate") or vehicle["plate"]).upper() for vehicle in vehicles if vehicle.get("plate")
+        }
+        self._votes.update(plates)
+
+        confident = any(
+            vehicle.get("confidence", 0) >= self._confidence_threshold for vehicle in vehicles
+        )
+        agreed = bool(self._votes) and self._votes.most_common(1)[0][1] >= self._agreement
+        if (confident or agreed) and self.scans < self._max_scans:
+            self.stopped_early = True
+
+    def cancel(self) -> None:
+        """Cancel the pending follow-up scan and stale timer."""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        if self.unsub_stale is not None:
+            self.unsub_stale()
+            self.unsub_stale = None
+
+    def next_delay(self) -> float:
+        """Return delay before the next scan based on the last frame."""
+        if not self.frames or not self.frames[-1]:
+            return self._base_delay * NO_VEHICLE_DELAY_FACTOR
+        return self._base_delay * LOW_CONFIDENCE_DELAY_FACTOR
+
+    @property
+    def best_plate(self) -> Optional[str]:
+        """Return plate seen in most frames."""
+        return self._votes.most_common(1)[0][0] if self._votes else None
+
+    @property
+    def summary(self) -> Dict:
+        """Return session summary for attributes."""
+        return {
+            "scans": self.scans,
+            "stopped_early": self.stopped_early,
+            "plate": self.best_plate,
+        }
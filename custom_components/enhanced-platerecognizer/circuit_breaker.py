@@ -0,0 +1,169 @@
+"""Circuit breaker for recognition servers."""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "enhanced_platerecognizer"
+
+EVENT_CIRCUIT_BREAKER = "enhanced_platerecognizer_circuit_breaker"
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_BACKOFF = 10.0  # seconds
+MAX_BACKOFF = 300.0  # seconds
+JITTER = 0.2  # +/- share of the backoff
+
+
+class CircuitOpenError(Exception):
+    """Server is considered down, scan failed fast."""
+
+
+def is_server_failure(exc: BaseException) -> bool:
+    """Return True if exc means the server is down rather than the request was bad."""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status >= 500
+    return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+class CircuitBreaker:
+    """Fail fast while a server is down and probe it with backoff.
+
+    Opens after failure_threshold consecutive failures. Once the jittered
+    backoff has passed a single probe request is let through (half open):
+    success closes the circuit, failure opens it again with doubled backoff.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        server: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        backoff: float = DEFAULT_BACKOFF,
+    ):
+        """Initialize breaker."""
+        self.hass = hass
+        self.server = server
+        self._failure_threshold = failure_threshold
+        self._backoff = backoff
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self._reopenings = 0
+        self._retry_at = 0.0
+        self._probe_in_flight = False
+
+    def _set_state(self, state: str) -> None:
+        """Change state and report the transition."""
+        previous, self.state = self.state, state
+        if previous == state:
+            return
+        retry_in = round(max(0.0, self._retry_at - time.monotonic()), 1) if state == STATE_OPEN else None
+        _LOGGER.warning(f"Circuit breaker for {self.server}: {previous} -> {state}")
+        self.hass.bus.async_fire(EVENT_CIRCUIT_BREAKER, {
+            'server': self.server,
+            'state': state,
+            'previous_state': previous,
+            'failures': self.failures,
+            'retry_in': retry_in,
+        })
+
+    def _open(self) -> None:
+        """Open circuit for the next backoff interval."""
+        delay = min(MAX_BACKOFF, self._backoff * (2 ** self._reopenings))
+        delay *= 1 + random.uniform(-JITTER, JITTER)
+        self._retry_at = time.monotonic() + delay
+        self._set_state(STATE_OPEN)
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are rejected without a probe being due."""
+        return self.state == STATE_OPEN and time.monotonic() < self._retry_at
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state == STATE_CLOSED:
+            return True
+        if self.state == STATE_OPEN and time.monotonic() >= self._retry_at:
+            self._set_state(STATE_HALF_OPEN)
+        if self.state == STATE_HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a request the server answered."""
+        self._probe_in_flight = False
+        self.failures = 0
+        self._reopenings = 0
+        self._set_state(STATE_CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed or timed out request."""
+        self._probe_in_flight = False
+        self.failures += 1
+        if self.state == STATE_HALF_OPEN:
+            self._reopenings += 1
+            self._open()
+        elif self.state == STATE_CLOSED and self.failures >= self._failure_threshold:
+            self._open()
+
+    def release(self) -> None:
+        """Forget a request that ended without an answer, e.g. cancelled."""
+        self._probe_in_flight = False
+
+    async def async_call(self, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Run request unless the circuit is open and record its outcome."""
+        if not self.allow_request():
+            raise CircuitOpenError(f"{self.server} is unavailable, circuit open")
+        try:
+            result = await request()
+        except Exception as err:
+            if is_server_failure(err):
+                self.record_failure()
+            else:
+                # Server answered, e.g. 429 or a rejected request
+                self.record_success()
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.record_success()
+        return result
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return breaker attributes."""
+        retry_in: Optional[float] = None
+        if self.state == STATE_OPEN:
+            retry_in = round(max(0.0, self._retry_at - time.monotonic()), 1)
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "retry_in": retry_in,
+        }
+
+
+@callback
+def async_get_breaker(
+    hass: HomeAssistant,
+    server: str,
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    backoff: float = DEFAULT_BACKOFF,
+) -> CircuitBreaker:
+    """Return the shared circuit breaker for server."""
+    breakers = hass.data.setdefault(DOMAIN, {}).setdefault("breakers", {})
+    breaker = breakers.get(server)
+    if breaker is None:
+        breaker = breakers[server] = CircuitBreaker(hass, server, failure_threshold, backoff)
+    return breaker
@@ -0,0 +1,75 @@
+"""Multi-frame character-level consensus for burst captures."""
+
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# Frames whose top plates differ in more positions belong to another vehicle
+MAX_TRACK_DISTANCE = 2
+
+
+def _distance(plate1: str, plate2: str) -> int:
+    """Return differing positions, or a large value for different lengths."""
+    if len(plate1) != len(plate2):
+        return len(plate1) + len(plate2)
+    return sum(1 for a, b in zip(plate1, plate2) if a != b)
+
+
+def _readings(result: Dict) -> List[Tuple[str, float]]:
+    """Return (plate, score) for every candidate reading of a result."""
+    candidates = result.get("candidates") or [
+        {"plate": result["plate"], "score": result.get("score", 0)}
+    ]
+    return [(cand["plate"].upper(), cand.get("score", 0)) for cand in candidates]
+
+
+def _fuse_track(track: List[Dict]) -> Dict:
+    """Fuse the results of one vehicle into a single result."""
+    readings = [reading for result in track for reading in _readings(result)]
+
+    # Align on the plate length carrying most of the weight
+    length_weight: Dict[int, float] = defaultdict(float)
+    for plate, score in readings:
+        length_weight[len(plate)] += score
+    length = max(length_weight, key=lambda size: (length_weight[size], size))
+
+    votes = [defaultdict(float) for _ in range(length)]
+    for plate, score in readings:
+        if len(plate) == length:
+            for position, char in enumerate(plate):
+                votes[position][char] += score
+
+    chars = []
+    agreement = []
+    for position_votes in votes:
+        char, weight = max(position_votes.items(), key=lambda item: (item[1], item[0]))
+        total = sum(position_votes.values())
+        chars.append(char)
+        agreement.append(weight / total if total else 0)
+
+    best = max(track, key=lambda result: result.get("score", 0))
+    return {
+        **best,
+        "plate": "".join(chars).lower(),
+        "score": round(sum(agreement) / len(agreement), 3) if agreement else 0,
+        "frames": len(track),
+    }
+
+
+def fuse_results(frames: List[List[Dict]]) -> List[Dict]:
+    """Return one fused result per vehicle seen across the frames of a burst.
+
+    Results are grouped into vehicles by their top plate, then every
+    candidate reading of a vehicle votes per character, weighted by score.
+    """
+    tracks: List[Tuple[str, List[Dict]]] = []
+    for results in frames:
+        for result in results:
+            if "plate" not in result:
+                continue
+            plate = result["plate"].upper()
+            distances = [_distance(plate, key) for key, _ in tracks]
+            if distances and min(distances) <= MAX_TRACK_DISTANCE:
+                tracks[distances.index(min(distances))][1].append(result)
+            else:
+                tracks.append((plate, [result]))
+    return [_fuse_track(track) for _, track in tracks]
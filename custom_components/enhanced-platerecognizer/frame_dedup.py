@@ -0,0 +1,76 @@
+"""Perceptual-hash deduplication of consecutive camera frames."""
+
+import io
+import time
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image
+
+HASH_SIZE = 8
+
+
+def frame_fingerprint(image, crop: Optional[Tuple[int, int, int, int]] = None) -> int:
+    """Return 64-bit difference hash (dHash) of the frame."""
+    frame = Image.open(io.BytesIO(image))
+    if crop:
+        frame = frame.crop(crop)
+    else:
+        # Only a thumbnail is needed, let the JPEG decoder skip most pixels
+        frame.draft("L", (HASH_SIZE * 8, HASH_SIZE * 8))
+    pixels = list(
+        frame.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.BILINEAR).getdata()
+    )
+
+    fingerprint = 0
+    for row in range(HASH_SIZE):
+        offset = row * (HASH_SIZE + 1)
+        for column in range(HASH_SIZE):
+            fingerprint <<= 1
+            if pixels[offset + column] > pixels[offset + column + 1]:
+                fingerprint |= 1
+    return fingerprint
+
+
+class FrameDeduplicator:
+    """Reuse the last result while frames stay perceptually identical."""
+
+    def __init__(self, threshold: int, window: float):
+        """Initialize deduplicator."""
+        self._threshold = threshold
+        self._window = window
+        self._fingerprint = None
+        self._results = None
+        self._stored_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.last_distance = None
+
+    def lookup(self, fingerprint: int) -> Optional[List[Dict]]:
+        """Return cached results if fingerprint matches the last uploaded frame."""
+        if self._fingerprint is None or time.monotonic() - self._stored_at > self._window:
+            self.last_distance = None
+            self.misses += 1
+            return None
+
+        self.last_distance = bin(self._fingerprint ^ fingerprint).count("1")
+        if self.last_distance <= self._threshold:
+            self.hits += 1
+            return self._results
+
+        self.misses += 1
+        return None
+
+    def store(self, fingerprint: int, results: List[Dict]) -> None:
+        """Remember fingerprint and results of an uploaded frame."""
+        self._fingerprint = fingerprint
+        self._results = results
+        self._stored_at = time.monotonic()
+
+    @property
+    def stats(self) -> Dict:
+        """Return counters for tuning the threshold."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "last_distance": self.last_distance,
+        }
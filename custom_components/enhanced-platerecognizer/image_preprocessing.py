@@ -0,0 +1,133 @@
+"""Image preprocessing applied before upload to Plate Recognizer."""
+
+import io
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from PIL import Image
+
+DEFAULT_JPEG_QUALITY = 90
+
+
+class BoxTransform(NamedTuple):
+    """Maps box coordinates of the uploaded image back to the original frame."""
+
+    scale_x: float = 1.0
+    scale_y: float = 1.0
+    offset_x: float = 0.0
+    offset_y: float = 0.0
+
+    @property
+    def is_identity(self) -> bool:
+        """Return True if uploaded and original coordinates are the same."""
+        return self == IDENTITY
+
+    def to_original(self, box: Dict[str, Any]) -> Dict[str, Any]:
+        """Return box translated to original frame coordinates."""
+        return {
+            **box,
+            "xmin": int(round(self.offset_x + box["xmin"] * self.scale_x)),
+            "xmax": int(round(self.offset_x + box["xmax"] * self.scale_x)),
+            "ymin": int(round(self.offset_y + box["ymin"] * self.scale_y)),
+            "ymax": int(round(self.offset_y + box["ymax"] * self.scale_y)),
+        }
+
+
+IDENTITY = BoxTransform()
+
+
+class PreprocessedImage(NamedTuple):
+    """Image bytes ready for upload."""
+
+    data: Any
+    transform: BoxTransform
+
+
+def image_size(image) -> Tuple[int, int]:
+    """Return frame size read from the image header, without decoding pixels."""
+    with Image.open(io.BytesIO(image)) as frame:
+        return frame.size
+
+
+def preprocess_image(
+    image,
+    max_edge: Optional[int] = None,
+    greyscale: bool = False,
+    jpeg_quality: Optional[int] = None,
+    crop: Optional[Tuple[int, int, int, int]] = None,
+) -> PreprocessedImage:
+    """Crop, downscale, convert and re-encode image according to options.
+
+    Without options a memoryview of the original bytes is returned, so the
+    frame is uploaded without being copied.
+    """
+    if not max_edge and not greyscale and not jpeg_quality and not crop:
+        return PreprocessedImage(memoryview(image), IDENTITY)
+
+    frame = Image.open(io.BytesIO(image))
+    offset_x, offset_y = 0, 0
+    if crop:
+        frame = frame.crop(crop)
+        offset_x, offset_y = crop[0], crop[1]
+    width, height = frame.size
+    target_size = None
+
+    if max_edge and max(width, height) > max_edge:
+        ratio = max_edge / max(width, height)
+        target_size = (max(1, round(width * ratio)), max(1, round(height * ratio)))
+        if not crop:
+            # Let the JPEG decoder scale down in the DCT domain where possible
+            frame.draft("L" if greyscale else "RGB", target_size)
+
+    if greyscale:
+        frame = frame.convert("L")
+    elif frame.mode not in ("RGB", "L"):
+        frame = frame.convert("RGB")
+
+    if target_size and frame.size != target_size:
+        frame = frame.resize(target_size, Image.BILINEAR)
+
+    buffer = io.BytesIO()
+    frame.save(buffer, format="JPEG", quality=jpeg_quality or DEFAULT_JPEG_QUALITY)
+
+    transform = BoxTransform(
+        width / frame.size[0], height / frame.size[1], offset_x, offset_y
+    )
+    return PreprocessedImage(buffer.getvalue(), transform)
+
+
+def load_and_preprocess(
+    path,
+    max_edge: Optional[int] = None,
+    greyscale: bool = False,
+    jpeg_quality: Optional[int] = None,
+    roi=None,
+) -> Tuple[int, int, PreprocessedImage]:
+    """Read an image file and preprocess it, for use in a process pool.
+
+    roi is an optional region of interest to crop to. Returns (width, height,
+    prepared image) with the prepared bytes copied so they can be pickled.
+    """
+    with open(path, "rb") as file:
+        image = file.read()
+    width, height = image_size(image)
+    crop = roi.crop_box(width, height) if roi else None
+    prepared = preprocess_image(image, max_edge, greyscale, jpeg_quality, crop)
+    return width, height, PreprocessedImage(bytes(prepared.data), prepared.transform)
+
+
+def _remap_result(result: Dict, transform: BoxTransform) -> Dict:
+    """Return result with its plate and vehicle boxes in original frame coordinates."""
+    result = dict(result)
+    if "box" in result:
+        result["box"] = transform.to_original(result["box"])
+    vehicle = result.get("vehicle")
+    if isinstance(vehicle, dict) and vehicle.get("box"):
+        result["vehicle"] = {**vehicle, "box": transform.to_original(vehicle["box"])}
+    return result
+
+
+def remap_results(results: List[Dict], transform: BoxTransform) -> List[Dict]:
+    """Translate result boxes back to original frame coordinates."""
+    if transform.is_identity:
+        return results
+    return [_remap_result(result, transform) for result in results]
@@ -1,19 +1,20 @@
 """Vehicle detection using Plate Recognizer cloud service."""
 
 import logging
-import requests
 import voluptuous as vol
 import re
-import io
 from typing import List, Dict
 import json
 import asyncio
+import aiohttp
+from functools import partial
 
 from homeassistant.core import HomeAssistant
-from PIL import Image, ImageDraw, UnidentifiedImageError
+from PIL import UnidentifiedImageError
 from pathlib import Path
 import os
 
+from homeassistant.components import camera
 from homeassistant.components.image_processing import (
     CONF_ENTITY_ID,
     CONF_NAME,
@@ -22,19 +23,78 @@ from homeassistant.components.image_processing import (
     ImageProcessingEntity,
 )
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import split_entity_id
+from homeassistant.core import callback, split_entity_id
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_call_later
 import homeassistant.util.dt as dt_util
-from homeassistant.util.pil import draw_box
 from datetime import datetime
 
+from .api_client import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_READ_TIMEOUT,
+    RateLimitedError,
+)
+from .image_preprocessing import image_size, preprocess_image, remap_results
+from .roi import RegionOfInterest
+from .frame_dedup import FrameDeduplicator, frame_fingerprint
+from .result_cache import DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL, ResultCache
+from .burst import DEFAULT_BURST_AGREEMENT, DEFAULT_BURST_CONFIDENCE, STALE_AFTER, BurstSession
+from .consensus import fuse_results
+from .replay import DEFAULT_PASSAGE_GAP, DEFAULT_REPLAY_WORKERS, async_replay
+from .scheduler import DEFAULT_MAX_IN_FLIGHT, async_get_scheduler
+from .budget import DEFAULT_BUDGET_RESERVE, BudgetExceededError, async_get_budget
+from .circuit_breaker import (
+    DEFAULT_BACKOFF,
+    DEFAULT_FAILURE_THRESHOLD,
+    CircuitOpenError,
+)
+from .backend_pool import (
+    CONF_FALLBACK,
+    CONF_URL,
+    CONF_WEIGHT,
+    async_get_backend_pool,
+    normalize_backends,
+)
+from .latency import (
+    EVENT_SCAN_TRACE,
+    STAGE_API_PROCESSING,
+    STAGE_CACHE,
+    STAGE_CAMERA_FETCH,
+    STAGE_DECODE,
+    STAGE_DISPATCH,
+    STAGE_FINGERPRINT,
+    STAGE_PARSE,
+    STAGE_PREPROCESS,
+    STAGE_QUEUE,
+    STAGE_SAVE,
+    STAGE_UPLOAD,
+    ScanTrace,
+    async_get_latency_tracker,
+    async_track_event_delivery,
+)
+from .snapshot_writer import (
+    DEFAULT_SNAPSHOT_FORMAT,
+    DEFAULT_SNAPSHOT_QUALITY,
+    DEFAULT_SNAPSHOT_QUEUE_POLICY,
+    DEFAULT_SNAPSHOT_QUEUE_SIZE,
+    POLICY_BLOCK,
+    POLICY_DROP_OLDEST,
+    SNAPSHOT_FORMATS,
+    SnapshotJob,
+    async_get_snapshot_writer,
+)
+from .api_statistics import (
+    DEFAULT_STATISTICS_INTERVAL,
+    async_get_statistics_service,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
-REPEATS = 3  # Number of additional scans
+REPEATS = 3  # Maximum number of additional scans
 DELAY = 1.2  # Base delay in seconds
 
 PLATE_READER_URL = "https://api.platerecognizer.com/v1/plate-reader/"
-STATS_URL = "https://api.platerecognizer.com/v1/statistics/"
 
 EVENT_VEHICLE_DETECTED = "platerecognizer.vehicle_detected"
 
@@ -45,6 +105,8 @@ ATTR_VEHICLE_TYPE = "vehicle_type"
 ATTR_ORIENTATION = "orientation"
 ATTR_BOX_Y_CENTRE = "box_y_centre"
 ATTR_BOX_X_CENTRE = "box_x_centre"
+ATTR_CANDIDATE = "candidate"
+ATTR_CANDIDATE_RANK = "candidate_rank"
 
 CONF_API_TOKEN = "api_token"
 CONF_REGIONS = "regions"
@@ -59,15 +121,65 @@ CONF_REGION_STRICT = "region"
 
 DATETIME_FORMAT = "%Y-%m-%d_%H-%M-%S"
 
-RED = (255, 0, 0)  # For objects within the ROI
-
 DEFAULT_REGIONS = ['None']
 
 CONF_CONSECUTIVE_CAPTURES = "consecutive_captures"
 CONF_TOLERATE_ONE_MISTAKE = "tolerate_one_mistake"
+CONF_BURST_CONFIDENCE = "burst_confidence"
+CONF_BURST_AGREEMENT = "burst_agreement"
+CONF_CONSENSUS = "consensus"
+CONF_MAX_CONCURRENT_UPLOADS = "max_concurrent_uploads"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_LIMIT_BURST = "rate_limit_burst"
+CONF_QUOTA_BUDGET = "quota_budget"
+CONF_BUDGET_RESERVE = "budget_reserve"
+CONF_LOW_PRIORITY_CAMERAS = "low_priority_cameras"
+CONF_CIRCUIT_FAILURE_THRESHOLD = "circuit_failure_threshold"
+CONF_CIRCUIT_BACKOFF = "circuit_backoff"
+CONF_TRACE_EVENTS = "trace_events"
+CONF_POOL_SIZE = "connection_pool_size"
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+CONF_READ_TIMEOUT = "read_timeout"
+CONF_STATISTICS_INTERVAL = "statistics_interval"
+CONF_MAX_IMAGE_EDGE = "max_image_edge"
+CONF_GREYSCALE = "greyscale"
+CONF_JPEG_QUALITY = "jpeg_quality"
+CONF_ROI = "roi"
+CONF_DEDUP_THRESHOLD = "dedup_threshold"
+CONF_DEDUP_WINDOW = "dedup_window"
+CONF_RESULT_CACHE_TTL = "result_cache_ttl"
+CONF_RESULT_CACHE_SIZE = "result_cache_size"
+CONF_SNAPSHOT_FORMAT = "snapshot_format"
+CONF_SNAPSHOT_QUALITY = "snapshot_quality"
+CONF_SNAPSHOT_QUEUE_SIZE = "snapshot_queue_size"
+CONF_SNAPSHOT_QUEUE_POLICY = "snapshot_queue_policy"
+
+DEFAULT_DEDUP_WINDOW = 10  # seconds
+
+ROI_COORDINATE = vol.All(vol.Coerce(float), vol.Range(min=0, max=1))
+ROI_SHAPE_SCHEMA = vol.Any(
+    vol.Schema({
+        vol.Required("x_min"): ROI_COORDINATE,
+        vol.Required("y_min"): ROI_COORDINATE,
+        vol.Required("x_max"): ROI_COORDINATE,
+        vol.Required("y_max"): ROI_COORDINATE,
+    }),
+    vol.Schema({
+        vol.Required("polygon"): vol.All(
+            [vol.ExactSequence([ROI_COORDINATE, ROI_COORDINATE])],
+            vol.Length(min=3),
+        ),
+    }),
+)
 
 DOMAIN = "enhanced_platerecognizer"
 
+BACKEND_SCHEMA = vol.Schema({
+    vol.Required(CONF_URL): cv.string,
+    vol.Optional(CONF_WEIGHT, default=1.0): vol.All(vol.Coerce(float), vol.Range(min=0.01)),
+    vol.Optional(CONF_FALLBACK, default=False): cv.boolean,
+})
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Required(CONF_API_TOKEN): cv.string,
     vol.Optional(CONF_REGIONS, default=DEFAULT_REGIONS): vol.All(
@@ -80,11 +192,79 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Optional(CONF_WATCHED_PLATES): vol.All(
         cv.ensure_list, [cv.string]
     ),
-    vol.Optional(CONF_SERVER, default=PLATE_READER_URL): cv.string,
+    vol.Optional(CONF_SERVER, default=PLATE_READER_URL): vol.Any(
+        cv.string, vol.All(cv.ensure_list, [vol.Any(cv.string, BACKEND_SCHEMA)])
+    ),
     vol.Optional(CONF_DETECTION_RULE, default=False): cv.string,
     vol.Optional(CONF_REGION_STRICT, default=False): cv.string,
     vol.Optional(CONF_CONSECUTIVE_CAPTURES, default=False): cv.boolean,
+    vol.Optional(CONF_BURST_CONFIDENCE, default=DEFAULT_BURST_CONFIDENCE): vol.All(
+        vol.Coerce(float), vol.Range(min=0, max=1)
+    ),
+    vol.Optional(CONF_BURST_AGREEMENT, default=DEFAULT_BURST_AGREEMENT): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+    vol.Optional(CONF_CONSENSUS, default=False): cv.boolean,
+    vol.Optional(CONF_MAX_CONCURRENT_UPLOADS, default=DEFAULT_MAX_IN_FLIGHT): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+    vol.Optional(CONF_RATE_LIMIT): vol.All(vol.Coerce(float), vol.Range(min=0.01)),
+    vol.Optional(CONF_RATE_LIMIT_BURST, default=1): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+    vol.Optional(CONF_QUOTA_BUDGET, default=False): cv.boolean,
+    vol.Optional(CONF_BUDGET_RESERVE, default=DEFAULT_BUDGET_RESERVE): vol.All(
+        vol.Coerce(float), vol.Range(min=0, max=1)
+    ),
+    vol.Optional(CONF_LOW_PRIORITY_CAMERAS, default=[]): cv.entity_ids,
+    vol.Optional(CONF_CIRCUIT_FAILURE_THRESHOLD, default=DEFAULT_FAILURE_THRESHOLD): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+    vol.Optional(CONF_CIRCUIT_BACKOFF, default=DEFAULT_BACKOFF): vol.All(
+        vol.Coerce(float), vol.Range(min=1)
+    ),
     vol.Optional(CONF_TOLERATE_ONE_MISTAKE, default=True): cv.boolean,
+    vol.Optional(CONF_TRACE_EVENTS, default=False): cv.boolean,
+    vol.Optional(CONF_POOL_SIZE, default=DEFAULT_POOL_SIZE): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+    vol.Optional(CONF_CONNECT_TIMEOUT, default=DEFAULT_CONNECT_TIMEOUT): vol.All(
+        vol.Coerce(float), vol.Range(min=0.1)
+    ),
+    vol.Optional(CONF_READ_TIMEOUT, default=DEFAULT_READ_TIMEOUT): vol.All(
+        vol.Coerce(float), vol.Range(min=0.1)
+    ),
+    vol.Optional(CONF_STATISTICS_INTERVAL, default=DEFAULT_STATISTICS_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=60)
+    ),
+    vol.Optional(CONF_MAX_IMAGE_EDGE): vol.All(vol.Coerce(int), vol.Range(min=64)),
+    vol.Optional(CONF_GREYSCALE, default=False): cv.boolean,
+    vol.Optional(CONF_JPEG_QUALITY): vol.All(vol.Coerce(int), vol.Range(min=1, max=95)),
+    vol.Optional(CONF_ROI, default={}): vol.Schema({
+        cv.entity_id: vol.All(cv.ensure_list, [ROI_SHAPE_SCHEMA])
+    }),
+    vol.Optional(CONF_DEDUP_THRESHOLD): vol.All(vol.Coerce(int), vol.Range(min=0, max=64)),
+    vol.Optional(CONF_DEDUP_WINDOW, default=DEFAULT_DEDUP_WINDOW): vol.All(
+        vol.Coerce(float), vol.Range(min=0)
+    ),
+    vol.Optional(CONF_RESULT_CACHE_TTL, default=DEFAULT_CACHE_TTL): vol.All(
+        vol.Coerce(float), vol.Range(min=0)
+    ),
+    vol.Optional(CONF_RESULT_CACHE_SIZE, default=DEFAULT_CACHE_SIZE): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+    vol.Optional(CONF_SNAPSHOT_FORMAT, default=DEFAULT_SNAPSHOT_FORMAT): vol.In(
+        list(SNAPSHOT_FORMATS)
+    ),
+    vol.Optional(CONF_SNAPSHOT_QUALITY, default=DEFAULT_SNAPSHOT_QUALITY): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=100)
+    ),
+    vol.Optional(CONF_SNAPSHOT_QUEUE_SIZE, default=DEFAULT_SNAPSHOT_QUEUE_SIZE): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+    vol.Optional(CONF_SNAPSHOT_QUEUE_POLICY, default=DEFAULT_SNAPSHOT_QUEUE_POLICY): vol.In(
+        [POLICY_DROP_OLDEST, POLICY_BLOCK]
+    ),
 })
 
 
@@ -102,6 +282,32 @@ def get_plates(results: List[Dict]) -> List[str]:
     return list(set(plates))
 
 
+def vehicle_from_result(result: Dict) -> Dict:
+    """Return vehicle attributes of a plate-reader result."""
+    box = result["box"]
+    return {
+        ATTR_PLATE: result["plate"],
+        ATTR_CONFIDENCE: result["score"],
+        ATTR_REGION_CODE: result["region"]["code"],
+        ATTR_VEHICLE_TYPE: result["vehicle"]["type"],
+        ATTR_BOX_Y_CENTRE: (box["ymin"] + ((box["ymax"] - box["ymin"]) / 2)),
+        ATTR_BOX_X_CENTRE: (box["xmin"] + ((box["xmax"] - box["xmin"]) / 2)),
+    }
+
+
+def add_candidate_matches(plate_manager, results: List[Dict], vehicles: List[Dict]) -> None:
+    """Add the candidate reading that matched the registry, and its rank, to each vehicle.
+
+    vehicles are built from the results with a plate, in the same order.
+    Without a registry hit both are None.
+    """
+    results = [result for result in results if "plate" in result]
+    matches = plate_manager.match_candidates(results) if plate_manager is not None else [None] * len(results)
+    for vehicle, match in zip(vehicles, matches):
+        vehicle[ATTR_CANDIDATE] = match.candidate.lower() if match else None
+        vehicle[ATTR_CANDIDATE_RANK] = match.rank if match else None
+
+
 def get_orientations(results: List[Dict]) -> List[str]:
     """
     Return the list of candidate orientations.
@@ -120,7 +326,41 @@ def get_orientations(results: List[Dict]) -> List[str]:
         _LOGGER.error("get_orientations error: %s", exc)
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
+SERVICE_REPLAY = "replay"
+ATTR_FOLDER = "folder"
+ATTR_OUTPUT = "output"
+ATTR_WORKERS = "workers"
+ATTR_LABELS = "labels"
+ATTR_LIMIT = "limit"
+ATTR_PASSAGE_GAP = "passage_gap"
+
+REPLAY_SCHEMA = vol.Schema({
+    vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+    vol.Required(ATTR_FOLDER): cv.isdir,
+    vol.Optional(ATTR_OUTPUT): cv.string,
+    vol.Optional(ATTR_WORKERS, default=DEFAULT_REPLAY_WORKERS): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+    vol.Optional(ATTR_LABELS): cv.isfile,
+    vol.Optional(ATTR_LIMIT): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional(ATTR_PASSAGE_GAP, default=DEFAULT_PASSAGE_GAP): vol.All(
+        vol.Coerce(float), vol.Range(min=0)
+    ),
+})
+
+
+def _prepare_save_folder(save_folder):
+    """Create save folder, return None if it can't be used."""
+    try:
+        Path(save_folder).mkdir(parents=True, exist_ok=True)
+        os.chmod(save_folder, 0o755)
+    except Exception as e:
+        _LOGGER.error("Failed to create folder %r: %s", save_folder, e)
+        return None
+    return save_folder
+
+
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the platform."""
     save_folder = config.get("save_file_folder")
     
@@ -134,12 +374,7 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
 
     # 2) If path is OK, create directory
     if save_folder:
-        try:
-            Path(save_folder).mkdir(parents=True, exist_ok=True)
-            os.chmod(save_folder, 0o755)
-        except Exception as e:
-            _LOGGER.error("Failed to create folder %r: %s", save_folder, e)
-            save_folder = None
+        save_folder = await hass.async_add_executor_job(_prepare_save_folder, save_folder)
 
     # Pass tolerate_one_mistake to hass.data
     domain = "enhanced_platerecognizer"
@@ -147,8 +382,65 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
         hass.data[domain] = {}
     hass.data[domain]["tolerate_one_mistake"] = config.get(CONF_TOLERATE_ONE_MISTAKE, True)
 
+    statistics = async_get_statistics_service(
+        hass,
+        config.get(CONF_API_TOKEN),
+        config.get(CONF_STATISTICS_INTERVAL, DEFAULT_STATISTICS_INTERVAL),
+    )
+    backend_entries = normalize_backends(config.get(CONF_SERVER, PLATE_READER_URL))
+    if any(entry[CONF_URL] == PLATE_READER_URL for entry in backend_entries):
+        statistics.async_start_polling()
+
+    # One cache shared by all cameras, so identical snapshots hit across entities
+    result_cache = None
+    if config.get(CONF_RESULT_CACHE_TTL, DEFAULT_CACHE_TTL) > 0:
+        result_cache = hass.data[domain].get("result_cache")
+        if result_cache is None:
+            result_cache = ResultCache(
+                config.get(CONF_RESULT_CACHE_SIZE, DEFAULT_CACHE_SIZE) * 1024,
+                config[CONF_RESULT_CACHE_TTL],
+            )
+            hass.data[domain]["result_cache"] = result_cache
+
+    snapshot_writer = None
+    if save_folder:
+        snapshot_writer = async_get_snapshot_writer(
+            hass,
+            config.get(CONF_SNAPSHOT_FORMAT, DEFAULT_SNAPSHOT_FORMAT),
+            config.get(CONF_SNAPSHOT_QUALITY, DEFAULT_SNAPSHOT_QUALITY),
+            config.get(CONF_SNAPSHOT_QUEUE_SIZE, DEFAULT_SNAPSHOT_QUEUE_SIZE),
+            config.get(CONF_SNAPSHOT_QUEUE_POLICY, DEFAULT_SNAPSHOT_QUEUE_POLICY),
+        )
+
+    scheduler = async_get_scheduler(
+        hass,
+        config.get(CONF_MAX_CONCURRENT_UPLOADS, DEFAULT_MAX_IN_FLIGHT),
+        config.get(CONF_RATE_LIMIT),
+        config.get(CONF_RATE_LIMIT_BURST, 1),
+    )
+
+    budget = None
+    if config.get(CONF_QUOTA_BUDGET, False):
+        budget = async_get_budget(
+            hass,
+            config.get(CONF_API_TOKEN),
+            statistics,
+            config.get(CONF_BUDGET_RESERVE, DEFAULT_BUDGET_RESERVE),
+        )
+
+    backends = async_get_backend_pool(
+        hass,
+        backend_entries,
+        config.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE),
+        config.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT),
+        config.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        config.get(CONF_CIRCUIT_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD),
+        config.get(CONF_CIRCUIT_BACKOFF, DEFAULT_BACKOFF),
+    )
+
     entities = []
-    for camera in config[CONF_SOURCE]:
+    for source in config[CONF_SOURCE]:
+        roi_shapes = config.get(CONF_ROI, {}).get(source[CONF_ENTITY_ID])
         platerecognizer = PlateRecognizerEntity(
             api_token=config.get(CONF_API_TOKEN),
             regions=config.get(CONF_REGIONS),
@@ -156,18 +448,61 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
             save_timestamped_file=config.get(CONF_SAVE_TIMESTAMPTED_FILE),
             always_save_latest_file=config.get(CONF_ALWAYS_SAVE_LATEST_FILE),
             watched_plates=config.get(CONF_WATCHED_PLATES),
-            camera_entity=camera[CONF_ENTITY_ID],
-            name=camera.get(CONF_NAME),
+            camera_entity=source[CONF_ENTITY_ID],
+            name=source.get(CONF_NAME),
             mmc=config.get(CONF_MMC),
-            server=config.get(CONF_SERVER),
+            server=backends,
             detection_rule=config.get(CONF_DETECTION_RULE),
             region_strict=config.get(CONF_REGION_STRICT),
             consecutive_captures=config.get(CONF_CONSECUTIVE_CAPTURES, False),
+            burst_confidence=config.get(CONF_BURST_CONFIDENCE, DEFAULT_BURST_CONFIDENCE),
+            burst_agreement=config.get(CONF_BURST_AGREEMENT, DEFAULT_BURST_AGREEMENT),
+            consensus=config.get(CONF_CONSENSUS, False),
+            statistics=statistics,
+            max_image_edge=config.get(CONF_MAX_IMAGE_EDGE),
+            greyscale=config.get(CONF_GREYSCALE, False),
+            jpeg_quality=config.get(CONF_JPEG_QUALITY),
+            roi=RegionOfInterest(roi_shapes) if roi_shapes else None,
+            dedup_threshold=config.get(CONF_DEDUP_THRESHOLD),
+            dedup_window=config.get(CONF_DEDUP_WINDOW, DEFAULT_DEDUP_WINDOW),
+            result_cache=result_cache,
+            snapshot_writer=snapshot_writer,
+            scheduler=scheduler,
+            budget=budget,
+            low_priority=source[CONF_ENTITY_ID] in config.get(CONF_LOW_PRIORITY_CAMERAS, []),
+            trace_events=config.get(CONF_TRACE_EVENTS, False),
             hass=hass,
         )
         entities.append(platerecognizer)
 
-    add_entities(entities)
+    async_add_entities(entities)
+
+    if not hass.services.has_service(domain, SERVICE_REPLAY):
+        async def async_handle_replay(call):
+            """Replay stored snapshots through an entity's pipeline."""
+            entity = hass.data[domain].get("entities", {}).get(call.data[ATTR_ENTITY_ID])
+            if entity is None:
+                _LOGGER.error(f"Replay: {call.data[ATTR_ENTITY_ID]} is not a Plate Recognizer entity")
+                return
+            folder = Path(call.data[ATTR_FOLDER])
+            output = Path(call.data.get(ATTR_OUTPUT) or folder / "replay.jsonl")
+            for path in (folder, output):
+                if not hass.config.is_allowed_path(str(path)):
+                    _LOGGER.error("Replay: path %r is not allowed in allowlist_external_dirs", str(path))
+                    return
+            labels = call.data.get(ATTR_LABELS)
+            await async_replay(
+                hass,
+                entity,
+                folder,
+                output,
+                call.data[ATTR_WORKERS],
+                Path(labels) if labels else None,
+                call.data.get(ATTR_LIMIT),
+                call.data[ATTR_PASSAGE_GAP],
+            )
+
+        hass.services.async_register(domain, SERVICE_REPLAY, async_handle_replay, schema=REPLAY_SCHEMA)
 
 
 class PlateRecognizerEntity(ImageProcessingEntity):
@@ -188,9 +523,26 @@ class PlateRecognizerEntity(ImageProcessingEntity):
         detection_rule,
         region_strict,
         consecutive_captures=False,
+        burst_confidence=DEFAULT_BURST_CONFIDENCE,
+        burst_agreement=DEFAULT_BURST_AGREEMENT,
+        consensus=False,
+        statistics=None,
+        max_image_edge=None,
+        greyscale=False,
+        jpeg_quality=None,
+        roi=None,
+        dedup_threshold=None,
+        dedup_window=DEFAULT_DEDUP_WINDOW,
+        result_cache=None,
+        snapshot_writer=None,
+        scheduler=None,
+        budget=None,
+        low_priority=False,
+        trace_events=False,
         hass=None,
     ):
         """Initialize the entity."""
+        self._api_token = api_token
         self._headers = {"Authorization": f"Token {api_token}"}
         self._regions = regions
         self._camera = camera_entity
@@ -207,6 +559,7 @@ class PlateRecognizerEntity(ImageProcessingEntity):
         self._always_save_latest_file = always_save_latest_file
         self._watched_plates = watched_plates
         self._mmc = mmc
+        # BackendPool of one or more recognition servers
         self._server = server
         self._detection_rule = detection_rule
         self._region_strict = region_strict
@@ -215,17 +568,45 @@ class PlateRecognizerEntity(ImageProcessingEntity):
         self._vehicles = [{}]
         self._orientations = []
         self._plates = []
-        self._statistics = {}
+        self._statistics = statistics
         self._last_detection = None
         self._image_width = None
         self._image_height = None
-        self._image = None
         self._config = {}
-        
-        self.get_statistics()
+        if self._detection_rule:
+            self._config.update({"detection_rule": self._detection_rule})
+        if self._region_strict:
+            self._config.update({"region": self._region_strict})
+
+        # Static request parts are built once and reused for every upload
+        self._form_fields = self._build_form_fields()
+
+        self._max_image_edge = max_image_edge
+        self._greyscale = greyscale
+        self._jpeg_quality = jpeg_quality
+        self._roi = roi
+        self._dedup = None
+        if dedup_threshold is not None:
+            self._dedup = FrameDeduplicator(dedup_threshold, dedup_window)
+        self._result_cache = result_cache
+        # Everything besides the image that influences the API answer
+        self._cache_params = json.dumps([self._regions, self._mmc, self._config])
+        self._snapshot_writer = snapshot_writer
+        self._scheduler = scheduler
+        self._budget = budget
+        self._low_priority = low_priority
+        self._trace_events = trace_events
+        self._latency = None
+        self._fetch_ms = None
+
         self._consecutive_captures = consecutive_captures
-        self._processing_additional_captures = False
-        self._current_capture_count = 0
+        self._burst_confidence = burst_confidence
+        self._burst_agreement = burst_agreement
+        # Consensus fuses the frames of a burst, so it needs consecutive captures
+        self._consensus = consensus and consecutive_captures
+        self._burst = None
+        # Set just before a burst follow-up scan, consumed by that scan
+        self._follow_up_scan = False
 
     def _get_translation(self, key: str, **kwargs) -> str:
         """Get translated text based on current language setting."""
@@ -247,6 +628,9 @@ class PlateRecognizerEntity(ImageProcessingEntity):
             'processing.image_error': 'Błąd obrazu',
             'processing.api_error': 'Błąd API',
             'processing.processing_error': 'Błąd przetwarzania',
+            'processing.rate_limited': 'Przekroczono limit API',
+            'processing.budget_throttled': 'Pominięto skan (limit miesięczny)',
+            'processing.circuit_open': 'Serwer niedostępny',
         }
         
         result = polish_translations.get(key, self._get_fallback_translation(key, **kwargs))
@@ -267,6 +651,9 @@ class PlateRecognizerEntity(ImageProcessingEntity):
             'processing.image_error': 'Image error',
             'processing.api_error': 'API error',
             'processing.processing_error': 'Processing error',
+            'processing.rate_limited': 'API rate limit exceeded',
+            'processing.budget_throttled': 'Scan skipped (monthly quota)',
+            'processing.circuit_open': 'Server unavailable',
         }
         
         result = fallbacks.get(key, key)
@@ -277,10 +664,174 @@ class PlateRecognizerEntity(ImageProcessingEntity):
                 pass
         return result
 
+    def _build_form_fields(self) -> List:
+        """Build form fields sent with every upload."""
+        fields = []
+        if self._regions != DEFAULT_REGIONS:
+            fields.extend(("regions", region) for region in self._regions)
+        fields.append(("camera_id", self.name))
+        fields.append(("mmc", str(self._mmc)))
+        fields.append(("config", json.dumps(self._config)))
+        _LOGGER.debug("Config: " + fields[-1][1])
+        return fields
+
+    def _crop_box(self):
+        """Return pixel crop box of the region of interest, if any."""
+        if self._roi:
+            return self._roi.crop_box(self._image_width, self._image_height)
+        return None
+
+    async def _async_preprocess(self, image):
+        """Run configured preprocessing off the event loop."""
+        crop = self._crop_box()
+        if not (self._max_image_edge or self._greyscale or self._jpeg_quality or crop):
+            return preprocess_image(image)
+        return await self.hass.async_add_executor_job(
+            preprocess_image,
+            image,
+            self._max_image_edge,
+            self._greyscale,
+            self._jpeg_quality,
+            crop,
+        )
+
+    async def _async_recognize(self, image, trace, follow_up=False):
+        """Return (results, response, backend) for image, skipping uploads of repeated frames.
+
+        backend is None when no upload was made.
+
+        Result boxes are in camera frame coordinates and limited to the ROI.
+        """
+        fingerprint = None
+        if self._dedup:
+            with trace.stage(STAGE_FINGERPRINT):
+                fingerprint = await self.hass.async_add_executor_job(
+                    frame_fingerprint, image, self._crop_box()
+                )
+            cached = self._dedup.lookup(fingerprint)
+            if cached is not None:
+                _LOGGER.debug(f"{self.entity_id}: frame unchanged, reusing previous result")
+                return cached, {}, None
+
+        with trace.stage(STAGE_PREPROCESS):
+            prepared = await self._async_preprocess(image)
+
+        results, response, backend = await self.async_recognize_prepared(
+            prepared, self._image_width, self._image_height, trace, follow_up
+        )
+
+        if fingerprint is not None:
+            self._dedup.store(fingerprint, results)
+        return results, response, backend
+
+    async def async_recognize_prepared(self, prepared, width, height, trace, follow_up=False):
+        """Return (results, response, backend) for an already preprocessed frame.
+
+        Answers from the result cache when possible, otherwise uploads. Used
+        by scans and by offline replay. follow_up marks a scheduled burst
+        follow-up scan.
+        """
+        response = None
+        backend = None
+        cache_key = None
+        if self._result_cache:
+            with trace.stage(STAGE_CACHE):
+                cache_key = await self.hass.async_add_executor_job(
+                    ResultCache.make_key, prepared.data, self._cache_params
+                )
+                response = self._result_cache.get(cache_key)
+
+        if response is None:
+            backend, response = await self._async_upload(prepared.data, trace, follow_up)
+            if "processing_time" in response:
+                # Time the server spent recognizing, part of the upload stage
+                trace.record(STAGE_API_PROCESSING, float(response["processing_time"]))
+            if cache_key is not None:
+                self._result_cache.put(cache_key, response)
+
+        with trace.stage(STAGE_PARSE):
+            # Boxes refer to the uploaded image, map them back to the camera frame
+            results = remap_results(response.get("results", []), prepared.transform)
+            if self._roi:
+                # Ignore vehicles outside the region, e.g. passing in the street
+                results = self._roi.filter_results(results, width, height)
+        return results, response, backend
+
+    def _is_low_priority(self, follow_up):
+        """Return True if this scan may be skipped first to save quota."""
+        # Burst follow-ups only confirm a plate that was already read
+        return self._low_priority or follow_up
+
+    async def _async_upload(self, data, trace, follow_up=False):
+        """Upload through the shared scheduler so all cameras respect global limits.
+
+        Returns (answering backend, response). Time spent waiting in the
+        scheduler is traced as queue, the HTTP round trips as upload.
+        """
+        # Fail fast while all servers are down instead of queueing doomed uploads
+        if self._server.is_open:
+            raise CircuitOpenError("All recognition backends are unavailable")
+        if self._budget and not self._budget.allow(self._is_low_priority(follow_up)):
+            raise BudgetExceededError("Scan skipped to stay within API quota")
+
+        async def upload():
+            with trace.stage(STAGE_UPLOAD):
+                return await self._server.async_post_image(data, self._form_fields, self._headers)
+
+        if self._scheduler is None:
+            return await upload()
+        submitted = ScanTrace()
+        try:
+            return await self._scheduler.async_submit(self._camera, self._api_token, upload)
+        finally:
+            waited = submitted.elapsed_ms() - trace.stages.get(STAGE_UPLOAD, 0.0)
+            trace.record(STAGE_QUEUE, max(0.0, waited))
+
+    async def async_added_to_hass(self):
+        """Make the entity reachable for the replay service and track event delivery."""
+        self.hass.data.setdefault(DOMAIN, {}).setdefault("entities", {})[self.entity_id] = self
+        self.async_on_remove(
+            async_track_event_delivery(self.hass, self.entity_id, 'enhanced_platerecognizer_image_processed')
+        )
+
+    async def async_will_remove_from_hass(self):
+        """Forget the entity and stop its burst."""
+        self.hass.data.get(DOMAIN, {}).get("entities", {}).pop(self.entity_id, None)
+        if self._burst is not None:
+            self._burst.cancel()
+
+    @property
+    def _plate_manager(self):
+        """Return the shared plate registry, if the integration is set up."""
+        return self.hass.data.get(DOMAIN, {}).get("plate_manager")
+
+    @property
+    def preprocess_options(self):
+        """Return (max_edge, greyscale, jpeg_quality, roi) applied before upload."""
+        return self._max_image_edge, self._greyscale, self._jpeg_quality, self._roi
+
+    @property
+    def consensus(self):
+        """Return True if burst frames are fused into one event."""
+        return self._consensus
+
+    async def async_update(self):
+        """Fetch a camera image, timing the fetch, and process it."""
+        fetch = ScanTrace()
+        image = await camera.async_get_image(
+            self.hass, self.camera_entity, timeout=self.timeout
+        )
+        self._fetch_ms = fetch.elapsed_ms()
+        await self.async_process_image(image.content)
+
     def process_image(self, image):
-        """Process image, handle errors and ALWAYS send event."""
-        self._current_capture_count += 1
+        """Process image from a worker thread by running the async pipeline."""
+        asyncio.run_coroutine_threadsafe(
+            self.async_process_image(image), self.hass.loop
+        ).result()
 
+    async def async_process_image(self, image):
+        """Process image, handle errors and ALWAYS send event."""
         # Reset states at the beginning
         self._state = None
         self._results = {}
@@ -288,63 +839,55 @@ class PlateRecognizerEntity(ImageProcessingEntity):
         self._plates = []
         self._orientations = []
 
+        # Only the scan started by _schedule_next_scan is a follow-up
+        follow_up = self._follow_up_scan
+        self._follow_up_scan = False
+
+        trace = ScanTrace()
+        if self._fetch_ms is not None:
+            trace.record(STAGE_CAMERA_FETCH, self._fetch_ms)
+            self._fetch_ms = None
+
         try:
-            self._image = Image.open(io.BytesIO(bytearray(image)))
-            self._image_width, self._image_height = self._image.size
+            # Only the header is parsed, pixels are decoded when saving
+            with trace.stage(STAGE_DECODE):
+                self._image_width, self._image_height = image_size(image)
         except UnidentifiedImageError:
             _LOGGER.error("Failed to open image. It may be corrupted.")
             self._state = self._get_translation('processing.image_error')
             
             # Despite error, send event - this is a KEY CHANGE
-            self.hass.bus.fire('enhanced_platerecognizer_image_processed', {
-                'entity_id': self.entity_id,
-                'has_vehicles': False,
-                'vehicles': [],
-                'timestamp': dt_util.now().strftime(DATETIME_FORMAT)
-            })
+            self._fire_image_processed([], dt_util.now().strftime(DATETIME_FORMAT))
+            self._record_trace(trace)
             return  # End execution of this method
 
-        if self._regions == DEFAULT_REGIONS:
-            regions = None
-        else:
-            regions = self._regions
+        response = {}
+        backend = None
+        try:
+            self._results, response, backend = await self._async_recognize(image, trace, follow_up)
+            with trace.stage(STAGE_PARSE):
+                self._plates = get_plates(self._results)
 
-        if self._detection_rule:
-            self._config.update({"detection_rule": self._detection_rule})
+                if self._mmc:
+                    self._orientations = get_orientations(self._results)
 
-        if self._region_strict:
-            self._config.update({"region": self._region_strict})
+                # Simplified and more reliable vehicle list creation logic
+                self._vehicles = [vehicle_from_result(r) for r in self._results if "plate" in r]
+                add_candidate_matches(self._plate_manager, self._results, self._vehicles)
 
-        try:
-            _LOGGER.debug("Config: " + str(json.dumps(self._config)))
-            response = requests.post(
-                self._server,
-                data=dict(regions=regions, camera_id=self.name, mmc=self._mmc, config=json.dumps(self._config)),
-                files={"upload": image},
-                headers=self._headers,
-                timeout=10  # Good practice to add timeout
-            ).json()
-
-            self._results = response.get("results", [])
-            self._plates = get_plates(self._results)
-
-            if self._mmc:
-                self._orientations = get_orientations(self._results)
-
-            # Simplified and more reliable vehicle list creation logic
-            self._vehicles = [
-                {
-                    ATTR_PLATE: r["plate"],
-                    ATTR_CONFIDENCE: r["score"],
-                    ATTR_REGION_CODE: r["region"]["code"],
-                    ATTR_VEHICLE_TYPE: r["vehicle"]["type"],
-                    ATTR_BOX_Y_CENTRE: (r["box"]["ymin"] + ((r["box"]["ymax"] - r["box"]["ymin"]) / 2)),
-                    ATTR_BOX_X_CENTRE: (r["box"]["xmin"] + ((r["box"]["xmax"] - r["box"]["xmin"]) / 2)),
-                }
-                for r in self._results if "plate" in r
-            ]
-
-        except requests.RequestException as exc:
+        except BudgetExceededError as exc:
+            _LOGGER.info("%s: %s", self.entity_id, exc)
+            self._state = self._get_translation('processing.budget_throttled')
+            self._vehicles = []
+        except CircuitOpenError as exc:
+            _LOGGER.debug("%s: %s", self.entity_id, exc)
+            self._state = self._get_translation('processing.circuit_open')
+            self._vehicles = []
+        except RateLimitedError as exc:
+            _LOGGER.error("Plate Recognizer API rate limit exceeded: %s", exc)
+            self._state = self._get_translation('processing.rate_limited')
+            self._vehicles = []
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
             _LOGGER.error("Connection error with Plate Recognizer API: %s", exc)
             self._state = self._get_translation('processing.api_error')
             self._vehicles = []
@@ -362,95 +905,146 @@ class PlateRecognizerEntity(ImageProcessingEntity):
         elif self._state is None:  # If there was no error but no vehicles
             self._state = f"no_vehicles_{current_time}"
 
+        if self._consecutive_captures:
+            self._update_burst()
+
+        # With consensus one fused event is sent per burst instead
+        if not self._consensus:
+            with trace.stage(STAGE_DISPATCH):
+                self._fire_image_processed(self._vehicles, current_time)
+
+        if self._save_file_folder and self._snapshot_writer:
+            if self._vehicles or self._always_save_latest_file:
+                with trace.stage(STAGE_SAVE):
+                    await self.async_save_image(image)
+
+        # Statistics are kept current from the response, no extra API call.
+        # Only cloud answers count against the token; SDK usage stays on its backend
+        if self._statistics is not None and backend is not None and backend.url == PLATE_READER_URL:
+            if "usage" in response:
+                self._statistics.async_update_from_usage(response["usage"])
+            else:
+                self._statistics.async_record_call()
+
+        self._record_trace(trace)
+
+    def _record_trace(self, trace):
+        """Add scan timings to the rolling latency stats, optionally as an event."""
+        if self._latency is None:
+            self._latency = async_get_latency_tracker(self.hass, self.entity_id)
+        stages = self._latency.record_trace(trace)
+        if self._trace_events:
+            self.hass.bus.async_fire(EVENT_SCAN_TRACE, {
+                'entity_id': self.entity_id,
+                'state': self._state,
+                'stages': stages,
+            })
+
+    def _fire_image_processed(self, vehicles, timestamp):
+        """Send 'enhanced_platerecognizer_image_processed' event."""
         _LOGGER.info(f"Sending 'enhanced_platerecognizer_image_processed' event for {self.entity_id}")
-        _LOGGER.debug(f"Event data: entity_id={self.entity_id}, has_vehicles={bool(self._vehicles)}, vehicles_count={len(self._vehicles)}")
-        _LOGGER.info(f"Preparing event for {self.entity_id} with data: has_vehicles={bool(self._vehicles)}")
+        _LOGGER.debug(f"Event data: entity_id={self.entity_id}, has_vehicles={bool(vehicles)}, vehicles_count={len(vehicles)}")
 
-        self.hass.bus.fire('enhanced_platerecognizer_image_processed', {
+        self.hass.bus.async_fire('enhanced_platerecognizer_image_processed', {
             'entity_id': self.entity_id,
-            'has_vehicles': bool(self._vehicles),
-            'vehicles': self._vehicles,
-            'timestamp': current_time
+            'has_vehicles': bool(vehicles),
+            'vehicles': vehicles,
+            'timestamp': timestamp
         })
 
-        if self._save_file_folder:
-            if self._vehicles or self._always_save_latest_file:
-                self.save_image()
+    def _fire_consensus(self, session):
+        """Send one event with the plates fused from all frames of a burst."""
+        session.reported = True
+        vehicles = []
+        fused = fuse_results(session.results)
+        for result in fused:
+            vehicle = vehicle_from_result(result)
+            vehicle["frames"] = result["frames"]
+            vehicles.append(vehicle)
+        add_candidate_matches(self._plate_manager, fused, vehicles)
+        _LOGGER.debug(f"{self.entity_id}: consensus of {session.scans} scan(s): {vehicles}")
+        self._fire_image_processed(vehicles, dt_util.now().strftime(DATETIME_FORMAT))
+
+    def _update_burst(self):
+        """Record scan in the burst session and schedule a follow-up if needed.
+
+        Runs in the event loop without awaiting, so overlapping triggers
+        always land in the same session.
+        """
+        previous = self._burst
+        if previous is None or previous.done:
+            if previous is not None and self._consensus and not previous.reported:
+                # Follow-up scan never arrived, report what was seen
+                self._fire_consensus(previous)
+            self._burst = BurstSession(
+                REPEATS + 1, DELAY, self._burst_confidence, self._burst_agreement
+            )
 
-        if self._server == PLATE_READER_URL:
-            self.get_statistics()
-        elif "usage" in response:
-            stats = response["usage"]
-            calls_remaining = stats.get("max_calls", 0) - stats.get("calls", 0)
-            stats.update({"calls_remaining": calls_remaining})
-            self._statistics = stats
+        session = self._burst
+        session.record(self._vehicles, self._results)
 
-        if self._consecutive_captures and self._current_capture_count == 1:
-            for i in range(1, REPEATS + 1):
-                self.hass.create_task(self._schedule_next_scan(DELAY * i))
+        if session.done:
+            session.cancel()
+            _LOGGER.debug(f"{self.entity_id}: burst finished after {session.scans} scan(s)")
+            if self._consensus:
+                self._fire_consensus(session)
+            return
 
-        if self._current_capture_count >= REPEATS + 1:
-            self._current_capture_count = 0
+        if session.task is None:
+            session.task = self.hass.async_create_task(
+                self._schedule_next_scan(session, session.next_delay())
+            )
+        if self._consensus:
+            # Report the passage even if its follow-up scan never records a result
+            if session.unsub_stale is not None:
+                session.unsub_stale()
+            session.unsub_stale = async_call_later(
+                self.hass, STALE_AFTER, partial(self._flush_stale_burst, session)
+            )
 
-    async def _schedule_next_scan(self, delay):
-        """Schedule next scan after specified delay."""
+    @callback
+    def _flush_stale_burst(self, session, _now):
+        """Send the consensus of a burst whose follow-up scan never arrived."""
+        session.unsub_stale = None
+        if session.reported:
+            return
+        session.cancel()
+        session.stale = True
+        _LOGGER.debug(f"{self.entity_id}: burst went stale after {session.scans} scan(s)")
+        self._fire_consensus(session)
+        self.async_write_ha_state()
+
+    async def _schedule_next_scan(self, session, delay):
+        """Schedule next scan of the burst after specified delay."""
         await asyncio.sleep(delay)
+        session.task = None
+        self._follow_up_scan = True
         await self.hass.services.async_call(
             "image_processing",
             "scan",
             {"entity_id": self.entity_id}
         )
 
-        # Reset flag after last scan
-        if self._current_capture_count >= 3:
-            self._current_capture_count = 0
-            self._processing_additional_captures = False
-
-    def get_statistics(self):
-        """Get API usage statistics."""
-        try:
-            response = requests.get(STATS_URL, headers=self._headers).json()
-            calls_remaining = response["total_calls"] - response["usage"]["calls"]
-            response.update({"calls_remaining": calls_remaining})
-            self._statistics = response.copy()
-        except Exception as exc:
-            _LOGGER.error("platerecognizer error getting statistics: %s", exc)
-
     def fire_vehicle_detected_event(self, vehicle):
         """Send event."""
         vehicle_copy = vehicle.copy()
         vehicle_copy.update({ATTR_ENTITY_ID: self.entity_id})
         self.hass.bus.fire(EVENT_VEHICLE_DETECTED, vehicle_copy)
 
-    def save_image(self):
-        """Save a timestamped image with bounding boxes around plates."""
-        draw = ImageDraw.Draw(self._image)
-        decimal_places = 3
-
-        for vehicle in self._results:
-            box = (
-                round(vehicle['box']["ymin"] / self._image_height, decimal_places),
-                round(vehicle['box']["xmin"] / self._image_width, decimal_places),
-                round(vehicle['box']["ymax"] / self._image_height, decimal_places),
-                round(vehicle['box']["xmax"] / self._image_width, decimal_places),
-            )
-            text = vehicle['plate']
-            draw_box(
-                draw,
-                box,
-                self._image_width,
-                self._image_height,
-                text=text,
-                color=RED,
-            )
-
-        latest_save_path = self._save_file_folder / f"{self._name}_latest.png"
-        self._image.save(latest_save_path)
+    async def async_save_image(self, image):
+        """Queue a snapshot with bounding boxes around plates.
 
+        Annotation and encoding happen once in the background writer, which
+        writes both the latest and the timestamped file from that encode.
+        """
+        extension = self._snapshot_writer.extension
+        paths = [self._save_file_folder / f"{self._name}_latest.{extension}"]
         if self._save_timestamped_file:
-            timestamp_save_path = self._save_file_folder / f"{self._name}_{self._last_detection}.png"
-            self._image.save(timestamp_save_path)
-            _LOGGER.info("platerecognizer saved file %s", timestamp_save_path)
+            paths.append(self._save_file_folder / f"{self._name}_{self._last_detection}.{extension}")
+
+        await self._snapshot_writer.async_submit(
+            SnapshotJob(image, self._results, self._image_width, self._image_height, paths)
+        )
 
     @property
     def camera_entity(self):
@@ -492,17 +1086,47 @@ class PlateRecognizerEntity(ImageProcessingEntity):
                     watched_plates_results.update({plate: True})
             attr[CONF_WATCHED_PLATES] = watched_plates_results
 
-        attr.update({"statistics": self._statistics})
+        attr.update({"statistics": self._statistics.snapshot if self._statistics else {}})
+
+        if self._dedup:
+            attr["dedup"] = self._dedup.stats
+
+        if self._result_cache:
+            attr["result_cache"] = self._result_cache.stats
 
         if self._regions != DEFAULT_REGIONS:
             attr[CONF_REGIONS] = self._regions
 
-        if self._server != PLATE_READER_URL:
-            attr[CONF_SERVER] = str(self._server)
+        backends = self._server.backends
+        if len(backends) > 1:
+            attr["backends"] = self._server.stats
+        elif backends[0].url != PLATE_READER_URL:
+            attr[CONF_SERVER] = backends[0].url
+
+        if self._roi and self._image_width:
+            attr[CONF_ROI] = self._roi.crop_box(self._image_width, self._image_height)
 
         if self._save_file_folder:
             attr[CONF_SAVE_FILE_FOLDER] = str(self._save_file_folder)
 
+        if self._scheduler:
+            attr["scheduler"] = self._scheduler.stats
+
+        if self._budget:
+            attr["budget"] = self._budget.stats
+
+        if len(backends) == 1:
+            attr["circuit_breaker"] = backends[0].breaker.stats
+
+        if self._burst:
+            attr["burst"] = self._burst.summary
+
+        if self._snapshot_writer:
+            attr["snapshot_writer"] = self._snapshot_writer.stats
+
+        if self._latency:
+            attr["latency"] = self._latency.summary
+
         attr[CONF_SAVE_TIMESTAMPTED_FILE] = self._save_timestamped_file
         attr[CONF_ALWAYS_SAVE_LATEST_FILE] = self._always_save_latest_file
 
@@ -0,0 +1,171 @@
+"""Per-stage latency tracking for the recognition pipeline."""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, Iterator, Optional
+
+from homeassistant.core import Event, HomeAssistant, callback
+import homeassistant.util.dt as dt_util
+
+DOMAIN = "enhanced_platerecognizer"
+
+EVENT_SCAN_TRACE = "enhanced_platerecognizer_scan_trace"
+
+STAGE_CAMERA_FETCH = "camera_fetch"
+STAGE_DECODE = "decode"
+STAGE_FINGERPRINT = "fingerprint"
+STAGE_PREPROCESS = "preprocess"
+STAGE_CACHE = "cache"
+STAGE_QUEUE = "queue"
+STAGE_UPLOAD = "upload"
+STAGE_API_PROCESSING = "api_processing"
+STAGE_PARSE = "parse"
+STAGE_DISPATCH = "dispatch"
+STAGE_SAVE = "save"
+STAGE_TOTAL = "total"
+STAGE_EVENT_DELIVERY = "event_delivery"
+
+DEFAULT_LATENCY_WINDOW = 256  # samples kept per stage
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_samples, pct: int) -> float:
+    """Return nearest-rank percentile of already sorted samples."""
+    rank = max(0, -(-pct * len(sorted_samples) // 100) - 1)
+    return sorted_samples[rank]
+
+
+class ScanTrace:
+    """Stage timings of one scan."""
+
+    def __init__(self):
+        """Initialize trace."""
+        self.stages: Dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    def record(self, stage: str, elapsed_ms: float) -> None:
+        """Add elapsed_ms to stage, repeated stages (retries) accumulate."""
+        self.stages[stage] = self.stages.get(stage, 0.0) + elapsed_ms
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, (time.perf_counter() - start) * 1000)
+
+    def elapsed_ms(self) -> float:
+        """Return ms since the trace started."""
+        return (time.perf_counter() - self._start) * 1000
+
+    def finish(self) -> Dict[str, float]:
+        """Record total time and return rounded stage timings."""
+        self.stages[STAGE_TOTAL] = self.elapsed_ms()
+        return {stage: round(ms, 1) for stage, ms in self.stages.items()}
+
+
+class LatencyTracker:
+    """Rolling per-stage latency samples of one camera."""
+
+    def __init__(self, window: int = DEFAULT_LATENCY_WINDOW):
+        """Initialize tracker."""
+        self._window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self.scans = 0
+
+    def record(self, stage: str, elapsed_ms: float) -> None:
+        """Add one sample for stage."""
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples[stage] = deque(maxlen=self._window)
+        samples.append(elapsed_ms)
+
+    def record_trace(self, trace: ScanTrace) -> Dict[str, float]:
+        """Finish trace, add its stages and return them."""
+        stages = trace.finish()
+        for stage, elapsed_ms in stages.items():
+            self.record(stage, elapsed_ms)
+        self.scans += 1
+        return stages
+
+    def stage_summary(self, stage: str) -> Optional[Dict[str, float]]:
+        """Return count and percentiles of stage, None without samples."""
+        samples = self._samples.get(stage)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        summary = {"count": len(ordered)}
+        for pct in PERCENTILES:
+            summary[f"p{pct}"] = round(percentile(ordered, pct), 1)
+        return summary
+
+    @property
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Return percentiles of every stage in ms."""
+        return {stage: self.stage_summary(stage) for stage in self._samples}
+
+
+@callback
+def async_get_latency_tracker(hass: HomeAssistant, entity_id: str) -> LatencyTracker:
+    """Return the latency tracker of an image processing entity."""
+    trackers = hass.data.setdefault(DOMAIN, {}).setdefault("latency", {})
+    tracker = trackers.get(entity_id)
+    if tracker is None:
+        tracker = trackers[entity_id] = LatencyTracker()
+    return tracker
+
+
+@callback
+def async_track_event_delivery(hass: HomeAssistant, entity_id: str, event_type: str) -> Callable[[], None]:
+    """Record how long events fired by entity_id take to reach listeners.
+
+    Recorded once per event, however many sensors listen. Returns the
+    function that stops tracking.
+    """
+    tracker = async_get_latency_tracker(hass, entity_id)
+
+    @callback
+    def record_delivery(event: Event) -> None:
+        if event.data.get("entity_id") == entity_id:
+            tracker.record(
+                STAGE_EVENT_DELIVERY,
+                (dt_util.utcnow() - event.time_fired).total_seconds() * 1000,
+            )
+
+    return hass.bus.async_listen(event_type, record_delivery)
+
+
+def timed_event_handler(handler: str, entity_attr: Optional[str] = None) -> Callable:
+    """Decorate a sensor's image processed event handler to time it.
+
+    Records how long the handler ran under the tracker of the entity that
+    fired the event. With entity_attr, only events from the entity id held
+    in that attribute are timed; the sensor ignores the others.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, event: Event, *args, **kwargs):
+            entity_id = event.data.get("entity_id")
+            if not entity_id or (entity_attr and entity_id != getattr(self, entity_attr)):
+                return func(self, event, *args, **kwargs)
+            tracker = async_get_latency_tracker(self.hass, entity_id)
+            start = time.perf_counter()
+            try:
+                return func(self, event, *args, **kwargs)
+            finally:
+                tracker.record(f"handler_{handler}", (time.perf_counter() - start) * 1000)
+
+        return wrapper
+
+    return decorator
+
+
+@callback
+def async_latency_summary(hass: HomeAssistant) -> Dict[str, Any]:
+    """Return percentiles of all trackers by entity id."""
+    trackers = hass.data.get(DOMAIN, {}).get("latency", {})
+    return {entity_id: tracker.summary for entity_id, tracker in trackers.items()}
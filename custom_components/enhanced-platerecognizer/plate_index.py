@@ -0,0 +1,122 @@
+"""Precomputed lookup index for the known plates registry."""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+# Character that never appears in a plate, used to mask one position
+WILDCARD = "\x00"
+
+
+def _wildcard_patterns(plate: str) -> Iterable[str]:
+    """Yield the plate with each position replaced by the wildcard."""
+    for position in range(len(plate)):
+        yield plate[:position] + WILDCARD + plate[position + 1:]
+
+
+def _discard(buckets: Dict[str, List[Any]], key: str, plate: Any) -> None:
+    """Remove plate from its bucket, dropping the bucket once empty."""
+    bucket = buckets.get(key)
+    if bucket is None:
+        return
+    bucket.remove(plate)
+    if not bucket:
+        del buckets[key]
+
+
+def plate_distance(plate1: str, plate2: str) -> int:
+    """Return number of differing characters between equal-length plates."""
+    return sum(1 for a, b in zip(plate1.upper(), plate2.upper()) if a != b)
+
+
+class PlateIndex:
+    """Per-position wildcard index over the registry.
+
+    Two plates of equal length differ in at most one character exactly when
+    they share one of their wildcard patterns, so an exact or one-mistake
+    query costs len(plate) dict lookups instead of a scan of the registry.
+    Results keep the registry (insertion) order. Single plates can be added
+    and removed in place, without rebuilding the index.
+    """
+
+    def __init__(self, plates: Optional[Iterable[Any]] = None):
+        """Initialize index."""
+        self._rank: Dict[Any, int] = {}
+        self._exact: Dict[str, List[Any]] = {}
+        self._wildcards: Dict[str, List[Any]] = {}
+        self._next_rank = 0
+        if plates:
+            self.rebuild(plates)
+
+    def rebuild(self, plates: Iterable[Any]) -> None:
+        """Rebuild the index from registry plates."""
+        rank: Dict[Any, int] = {}
+        exact: Dict[str, List[Any]] = {}
+        wildcards: Dict[str, List[Any]] = {}
+
+        for position, plate in enumerate(plates):
+            rank[plate] = position
+            key = str(plate).upper()
+            exact.setdefault(key, []).append(plate)
+            for pattern in _wildcard_patterns(key):
+                wildcards.setdefault(pattern, []).append(plate)
+
+        self._rank = rank
+        self._exact = exact
+        self._wildcards = wildcards
+        self._next_rank = len(rank)
+
+    def add(self, plate: Any) -> None:
+        """Index plate after all others, like a new registry entry."""
+        if plate in self._rank:
+            return
+        # Ranks only grow, so buckets stay in registry order
+        self._rank[plate] = self._next_rank
+        self._next_rank += 1
+        key = str(plate).upper()
+        self._exact.setdefault(key, []).append(plate)
+        for pattern in _wildcard_patterns(key):
+            self._wildcards.setdefault(pattern, []).append(plate)
+
+    def remove(self, plate: Any) -> None:
+        """Drop plate from the index."""
+        if self._rank.pop(plate, None) is None:
+            return
+        key = str(plate).upper()
+        _discard(self._exact, key, plate)
+        for pattern in _wildcard_patterns(key):
+            _discard(self._wildcards, pattern, plate)
+
+    def __len__(self) -> int:
+        """Return number of indexed plates."""
+        return len(self._rank)
+
+    def _buckets(self, plate: str) -> List[List[Any]]:
+        """Return index buckets holding plates within one mistake."""
+        key = plate.upper()
+        buckets = [self._exact[key]] if key in self._exact else []
+        for pattern in _wildcard_patterns(key):
+            bucket = self._wildcards.get(pattern)
+            if bucket:
+                buckets.append(bucket)
+        return buckets
+
+    def exact(self, plate: str) -> List[Any]:
+        """Return registry plates equal to plate (case-insensitive)."""
+        return list(self._exact.get(plate.upper(), ()))
+
+    def first_exact(self, plate: str) -> Optional[Any]:
+        """Return first registry plate equal to plate (case-insensitive)."""
+        bucket = self._exact.get(plate.upper())
+        return bucket[0] if bucket else None
+
+    def first_similar(self, plate: str) -> Optional[Any]:
+        """Return first registry plate within one mistake of plate."""
+        buckets = self._buckets(plate)
+        if not buckets:
+            return None
+        # Buckets are filled in registry order, so their heads are their minima
+        return min((bucket[0] for bucket in buckets), key=self._rank.__getitem__)
+
+    def similar(self, plate: str) -> List[Any]:
+        """Return all registry plates within one mistake of plate."""
+        found = {known for bucket in self._buckets(plate) for known in bucket}
+        return sorted(found, key=self._rank.__getitem__)
@@ -0,0 +1,208 @@
+"""Bulk import and export of the plate registry."""
+
+import csv
+import io
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+import homeassistant.helpers.config_validation as cv
+
+from .plate_store import write_atomic
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "enhanced_platerecognizer"
+
+SERVICE_IMPORT_PLATES = "import_plates"
+SERVICE_EXPORT_PLATES = "export_plates"
+EVENT_PLATES_IMPORTED = "enhanced_platerecognizer_plates_imported"
+EVENT_PLATES_EXPORTED = "enhanced_platerecognizer_plates_exported"
+
+ATTR_FILE = "file"
+ATTR_FORMAT = "format"
+ATTR_REPLACE = "replace"
+
+FORMAT_CSV = "csv"
+FORMAT_JSON = "json"
+FORMAT_JSONL = "jsonl"
+FORMATS = [FORMAT_CSV, FORMAT_JSON, FORMAT_JSONL]
+
+MAX_PLATE_LENGTH = 16
+# Rejected rows listed in the summary event; the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+# Separators people type into plates but the API never returns
+PLATE_SEPARATORS = re.compile(r"[\s\-]+")
+
+IMPORT_SCHEMA = vol.Schema({
+    vol.Required(ATTR_FILE): cv.isfile,
+    vol.Optional(ATTR_FORMAT): vol.In(FORMATS),
+    vol.Optional(ATTR_REPLACE, default=False): cv.boolean,
+})
+
+EXPORT_SCHEMA = vol.Schema({
+    vol.Required(ATTR_FILE): cv.string,
+    vol.Optional(ATTR_FORMAT): vol.In(FORMATS),
+})
+
+
+def file_format(path: Path, requested: Optional[str] = None) -> str:
+    """Return the requested format, or the one implied by the file extension."""
+    if requested:
+        return requested
+    suffix = path.suffix.lower().lstrip(".")
+    if suffix not in FORMATS:
+        raise ValueError(f"Cannot tell the format of {path.name}, pass format: csv, json or jsonl")
+    return suffix
+
+
+def normalize_plate(value: Any) -> str:
+    """Return plate upper-cased without spaces and dashes, or raise ValueError."""
+    plate = PLATE_SEPARATORS.sub("", str(value or "")).upper()
+    if not plate:
+        raise ValueError("empty plate")
+    if len(plate) > MAX_PLATE_LENGTH:
+        raise ValueError(f"longer than {MAX_PLATE_LENGTH} characters")
+    if not plate.isalnum():
+        raise ValueError("only letters and digits are allowed")
+    return plate
+
+
+def _fields(item: Any) -> Tuple[Any, Any, Optional[str]]:
+    """Return plate, owner and error of a JSON item; anything else is rejected as empty."""
+    if isinstance(item, dict):
+        return item.get("plate"), item.get("owner"), None
+    return None, None, None
+
+
+def _rows(path: Path, fmt: str) -> Iterable[Tuple[int, Any, Any, Optional[str]]]:
+    """Yield (line or item number, plate, owner, error) from the file, streaming where the format allows.
+
+    error is set for rows that cannot be parsed at all; they are rejected
+    without aborting the import.
+    """
+    if fmt == FORMAT_CSV:
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            for number, row in enumerate(csv.reader(file), start=1):
+                if not row or (number == 1 and row[0].strip().lower() == "plate"):
+                    continue  # Blank line or header
+                yield number, row[0], row[1] if len(row) > 1 else None, None
+    elif fmt == FORMAT_JSONL:
+        with open(path, encoding="utf-8-sig") as file:
+            for number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                except ValueError as exc:
+                    yield number, None, None, f"invalid JSON: {exc}"
+                    continue
+                yield (number, *_fields(item))
+    else:
+        with open(path, encoding="utf-8-sig") as file:
+            data = json.load(file)
+        if isinstance(data, dict):
+            # {"plates": {...}} like plates.yaml, or a plain plate to owner mapping
+            data = data.get("plates", data)
+        if isinstance(data, dict):
+            items = ({"plate": plate, "owner": owner} for plate, owner in data.items())
+        elif isinstance(data, list):
+            items = data
+        else:
+            raise ValueError("expected a list of plates or a plate to owner mapping")
+        for number, item in enumerate(items, start=1):
+            yield (number, *_fields(item))
+
+
+def read_plates(path: Path, fmt: str) -> Tuple[Dict[str, str], int, List[Dict[str, Any]]]:
+    """Return valid plates, the number of rejected rows and the first rejections."""
+    plates: Dict[str, str] = {}
+    rejected = 0
+    errors: List[Dict[str, Any]] = []
+    for number, plate, owner, error in _rows(path, fmt):
+        try:
+            if error:
+                raise ValueError(error)
+            plate = normalize_plate(plate)
+            owner = str(owner or "").strip()
+            if not owner:
+                raise ValueError("missing owner")
+        except ValueError as exc:
+            rejected += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"row": number, "plate": str(plate or ""), "reason": str(exc)})
+            continue
+        # Later rows win, like later edits
+        plates[plate] = owner
+    return plates, rejected, errors
+
+
+def write_plates(path: Path, plates: Dict[str, str], fmt: str) -> None:
+    """Write the registry to path atomically."""
+    if fmt == FORMAT_CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["plate", "owner"])
+        writer.writerows(plates.items())
+        content = buffer.getvalue()
+    elif fmt == FORMAT_JSONL:
+        content = "".join(
+            json.dumps({"plate": plate, "owner": owner}, ensure_ascii=False) + "\n"
+            for plate, owner in plates.items()
+        )
+    else:
+        content = json.dumps(
+            [{"plate": plate, "owner": owner} for plate, owner in plates.items()],
+            ensure_ascii=False,
+            indent=2,
+        )
+    write_atomic(str(path), content)
+
+
+def async_setup_plate_services(hass: HomeAssistant, plate_manager) -> None:
+    """Register the import_plates and export_plates services."""
+
+    async def async_handle_import(call: ServiceCall) -> None:
+        """Validate a file of plates and apply it to the registry at once."""
+        path = Path(call.data[ATTR_FILE])
+        if not hass.config.is_allowed_path(str(path)):
+            _LOGGER.error(f"Import plates: path {path} is not allowed in allowlist_external_dirs")
+            return
+        try:
+            fmt = file_format(path, call.data.get(ATTR_FORMAT))
+            plates, rejected, errors = await hass.async_add_executor_job(read_plates, path, fmt)
+        except (OSError, ValueError) as exc:
+            _LOGGER.error(f"Import plates: cannot read {path}: {exc}")
+            return
+
+        summary = await plate_manager.async_import_plates(plates, call.data[ATTR_REPLACE])
+        if summary is None:
+            return
+        summary.update({"file": str(path), "rejected": rejected, "errors": errors})
+        _LOGGER.info(f"Imported plates from {path}: {summary}")
+        hass.bus.async_fire(EVENT_PLATES_IMPORTED, summary)
+
+    async def async_handle_export(call: ServiceCall) -> None:
+        """Write the registry to a file."""
+        path = Path(call.data[ATTR_FILE])
+        if not hass.config.is_allowed_path(str(path)):
+            _LOGGER.error(f"Export plates: path {path} is not allowed in allowlist_external_dirs")
+            return
+        plates = plate_manager.get_all_plates()
+        try:
+            fmt = file_format(path, call.data.get(ATTR_FORMAT))
+            await hass.async_add_executor_job(write_plates, path, plates, fmt)
+        except (OSError, ValueError) as exc:
+            _LOGGER.error(f"Export plates: cannot write {path}: {exc}")
+            return
+        _LOGGER.info(f"Exported {len(plates)} plates to {path}")
+        hass.bus.async_fire(EVENT_PLATES_EXPORTED, {"file": str(path), "plates": len(plates)})
+
+    hass.services.async_register(DOMAIN, SERVICE_IMPORT_PLATES, async_handle_import, schema=IMPORT_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_EXPORT_PLATES, async_handle_export, schema=EXPORT_SCHEMA)
@@ -2,19 +2,83 @@
 
 import logging
 import os
-import yaml
-import aiofiles
-import aiofiles.os
-from typing import Dict, List, Any
+import numpy as np
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_state_change_event
-from homeassistant.const import EVENT_HOMEASSISTANT_START
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
+
+from .plate_index import PlateIndex, plate_distance
+from .plate_io import normalize_plate
+from .plate_matrix import BatchMatch, PlateMatrix
+from .plate_store import plate_store_from_config
+from .similarity import weighted_index_from_config
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "enhanced_platerecognizer"
 
+# Seconds of registry edits folded into one input_select refresh
+INPUT_SELECT_DELAY = 1.0
+
+# Unique readings from which a lookup goes through the batch matrix instead of the index
+MATRIX_MIN_BATCH = 256
+
+
+def _registry_plate(plate: Any) -> str:
+    """Return a registry key spelled the way imported plates are."""
+    try:
+        return normalize_plate(plate)
+    except ValueError:
+        return str(plate).upper()
+
+
+class PlateMatch(NamedTuple):
+    """Result of matching a detected plate against the registry.
+
+    distance is the number of differing characters, or the weighted edit
+    cost with weighted similarity.
+    """
+
+    query: str
+    plate: Optional[str]
+    owner: Optional[str]
+    distance: Optional[float]
+    ambiguous: bool
+    candidates: Tuple[str, ...]
+
+    @property
+    def known(self) -> bool:
+        """Return True if plate matched a registry entry."""
+        return self.plate is not None
+
+
+class CandidateMatch(NamedTuple):
+    """Registry hit of the best matching candidate reading of a result."""
+
+    candidate: str
+    rank: int
+    score: float
+    plate: Any
+    owner: str
+    distance: float
+    ambiguous: bool
+
+
+def _readings(result: Dict[str, Any]) -> List[Tuple[str, float]]:
+    """Return (plate, score) of every candidate of a result, top plate first."""
+    readings = [
+        (candidate["plate"].upper(), candidate.get("score", 0))
+        for candidate in result.get("candidates") or ()
+        if candidate.get("plate")
+    ]
+    top = result.get("plate")
+    if top and top.upper() not in (plate for plate, _ in readings):
+        readings.insert(0, (top.upper(), result.get("score", 0)))
+    return readings
+
+
 class PlateManager:
     def __init__(self, hass: HomeAssistant, config: Dict[str, Any]):
         """Initialize PlateManager."""
@@ -25,11 +89,20 @@ class PlateManager:
         # Changed path - now points to /config/plates.yaml
         file_name = "plates.yaml"
         self.plates_file = self.hass.config.path(file_name)
+        # plates.yaml, or an SQLite database for large registries
+        self._store = plate_store_from_config(hass, config)
+        self._unsub_input_select = None
+        self._loaded = False
         
         # Load plates asynchronously in setup_listeners
         self.known_plates = {}
+        self._index = PlateIndex()
+        self._matrix: Optional[PlateMatrix] = None
+        # Confusion-aware matching replaces tolerate_one_mistake when configured
+        self._weighted = weighted_index_from_config(config)
         
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, self._setup_listeners)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._close_store)
 
     def _get_translation(self, key: str, **kwargs) -> str:
         """Get translated text based on current language setting."""
@@ -71,43 +144,77 @@ class PlateManager:
                 pass
         return result
 
+    def _set_known_plates(self, plates: Dict[str, str]):
+        """Replace known plates and rebuild lookup index."""
+        self.known_plates = plates if plates is not None else {}
+        if self._weighted is not None:
+            self._weighted.rebuild(self.known_plates)
+        else:
+            self._index.rebuild(self.known_plates)
+        # Batch matrix is built on first use of match_many
+        self._matrix = None
+
     async def _load_plates(self) -> Dict[str, str]:
-        """Load plates from YAML file asynchronously."""
+        """Load plates from the registry store."""
         try:
-            if await aiofiles.os.path.exists(self.plates_file):
-                async with aiofiles.open(self.plates_file, 'r', encoding='utf-8') as file:
-                    content = await file.read()
-                    if not content.strip():  # Empty file
-                        return {}
-                    data = yaml.safe_load(content)
-                    if data is None:  # Invalid YAML
-                        return {}
-                    return data.get('plates', {})
-            else:
-                await self._save_plates({})
-                return {}
+            return await self._store.async_load()
         except Exception as e:
             _LOGGER.error(f"Error loading plates: {e}")
             return {}
 
-    async def _save_plates(self, plates: Dict[str, str]):
-        """Save plates to YAML file asynchronously."""
+    def _edit_known_plates(self, changes: Dict[str, Optional[str]]):
+        """Apply a few changes to known plates and the lookup index in place."""
+        index = self._weighted if self._weighted is not None else self._index
+        for plate, owner in changes.items():
+            if owner is None:
+                if self.known_plates.pop(plate, None) is not None:
+                    index.remove(plate)
+            else:
+                if plate not in self.known_plates:
+                    index.add(plate)
+                self.known_plates[plate] = owner
+        self._matrix = None
+
+    async def _save_plates(self, changes: Dict[str, Optional[str]], plates: Optional[Dict[str, str]] = None):
+        """Apply changes (plate to owner, None when removed) at once and persist them.
+
+        Single edits update the registry in place; bulk changes pass the new
+        registry as plates, which rebuilds the index once.
+        """
+        if plates is None:
+            self._edit_known_plates(changes)
+        else:
+            self._set_known_plates(plates)
+        self._schedule_input_select_update()
         try:
-            data = {'plates': plates}
-            content = yaml.dump(data, default_flow_style=False, allow_unicode=True)
-            async with aiofiles.open(self.plates_file, 'w', encoding='utf-8') as file:
-                await file.write(content)
-            self.known_plates = plates
-            await self._update_input_select()
-            _LOGGER.info(f"Saved plates: {list(plates.keys())}")
+            await self._store.async_apply(self.known_plates, changes)
+            _LOGGER.info(f"Saved plates: {list(changes)}")
         except Exception as e:
             _LOGGER.error(f"Error saving plates: {e}")
 
+    @callback
+    def _schedule_input_select_update(self):
+        """Refresh input_select once for a burst of edits."""
+        if self._unsub_input_select is None:
+            self._unsub_input_select = async_call_later(
+                self.hass, INPUT_SELECT_DELAY, self._handle_input_select_timer
+            )
+
+    async def _handle_input_select_timer(self, _now):
+        """Refresh input_select after the edits have settled."""
+        self._unsub_input_select = None
+        await self._update_input_select()
+
+    async def _close_store(self, event):
+        """Release the registry store on shutdown."""
+        await self._store.async_close()
+
     async def _setup_listeners(self, event):
         """Set up state change listeners."""
         # Load plates asynchronously with protection
         loaded_plates = await self._load_plates()
-        self.known_plates = loaded_plates if loaded_plates is not None else {}
+        self._set_known_plates(loaded_plates)
+        self._loaded = True
         _LOGGER.info(f"Loaded {len(self.known_plates)} plates")
 
         # Listen to changes in input_text SEPARATELY for each
@@ -174,9 +281,7 @@ class PlateManager:
                 _LOGGER.info(f"Adding plate: {plate_number} -> {owner_name}")
 
                 # Add plate
-                new_plates = self.known_plates.copy()
-                new_plates[plate_number] = owner_name
-                await self._save_plates(new_plates)
+                await self._save_plates({plate_number: owner_name})
 
                 # Clear input fields - IMPORTANT: add small delay
                 await self.hass.async_add_executor_job(lambda: __import__('time').sleep(0.2))
@@ -218,10 +323,8 @@ class PlateManager:
             _LOGGER.info(f"Remove plate selected: {selected}")
 
             # Remove plate
-            new_plates = self.known_plates.copy()
-            if selected in new_plates:
-                del new_plates[selected]
-                await self._save_plates(new_plates)
+            if selected in self.known_plates:
+                await self._save_plates({selected: None})
                 _LOGGER.info(f"Removed plate: {selected}")
 
                 # Force UI update
@@ -229,6 +332,59 @@ class PlateManager:
                     'plate': selected
                 })
 
+    async def async_import_plates(self, plates: Dict[str, str], replace: bool = False) -> Optional[Dict[str, int]]:
+        """Apply validated plates in one store write, index rebuild and input_select refresh.
+
+        Existing plates are kept unless replace is set. Returns counts of
+        added, updated, removed and unchanged plates, or None before the
+        registry is loaded.
+        """
+        if not self._loaded:
+            _LOGGER.error("Import plates: registry not loaded yet, try again after Home Assistant has started")
+            return None
+
+        # plates.yaml may hold keys the importer would spell differently, e.g. an int 12345
+        registry_keys: Dict[str, List[Any]] = {}
+        for key in self.known_plates:
+            registry_keys.setdefault(_registry_plate(key), []).append(key)
+
+        changes: Dict[str, Optional[str]] = {}
+        added = updated = 0
+        for plate, owner in plates.items():
+            keys = registry_keys.get(plate)
+            if not keys:
+                changes[plate] = owner
+                added += 1
+                continue
+            # Fold other spellings of the plate into the normalised key
+            changes.update({key: None for key in keys if key != plate})
+            current = self.known_plates.get(plate, self.known_plates[keys[0]])
+            if plate not in self.known_plates or current != owner:
+                changes[plate] = owner
+            if str(current) != owner:
+                updated += 1
+        removed = [
+            key for plate, keys in registry_keys.items() if plate not in plates for key in keys
+        ] if replace else []
+        changes.update({key: None for key in removed})
+
+        if changes:
+            new_plates = self.known_plates.copy()
+            for plate, owner in changes.items():
+                if owner is None:
+                    new_plates.pop(plate, None)
+                else:
+                    new_plates[plate] = owner
+            await self._save_plates(changes, new_plates)
+
+        return {
+            "added": added,
+            "updated": updated,
+            "removed": len(removed),
+            "unchanged": len(plates) - added - updated,
+            "plates": len(self.known_plates),
+        }
+
     async def _update_input_select(self):
         """Update input_select options with proper default option using translations."""
         try:
@@ -268,16 +424,119 @@ class PlateManager:
         except Exception as e:
             _LOGGER.error(f"Error updating input_select: {e}")
 
+    def match(self, plate: str) -> PlateMatch:
+        """Match plate against the registry in a single lookup.
+
+        Registry plates within tolerance are ranked by distance, then
+        alphabetically; the match is ambiguous when the best distance is tied.
+        """
+        query = plate.upper()
+        if self._weighted is not None:
+            ranked = self._weighted.ranked(query)
+        else:
+            if self.tolerate_one_mistake:
+                found = self._index.similar(query)
+            else:
+                found = self._index.exact(query)
+            ranked = sorted(
+                ((plate_distance(query, str(known)), str(known), known) for known in found)
+            )
+
+        if not ranked:
+            return PlateMatch(query, None, None, None, False, ())
+
+        best_distance, _, best_plate = ranked[0]
+        ambiguous = len(ranked) > 1 and ranked[1][0] == best_distance
+        return PlateMatch(
+            query,
+            best_plate,
+            self.known_plates[best_plate],
+            best_distance,
+            ambiguous,
+            tuple(known for _, _, known in ranked),
+        )
+
+    def match_many(self, plates: List[str]) -> BatchMatch:
+        """Match a batch of plates against the registry at once.
+
+        Agrees with match() plate by plate: registry is the known plates in
+        registry order and indices point into it. Worth it for large batches
+        such as replays; single scans are cheaper through match().
+        With weighted similarity plates are matched one by one and distances
+        are costs.
+        """
+        if self._weighted is not None:
+            return self._match_many_weighted(plates)
+        if self._matrix is None:
+            self._matrix = PlateMatrix(self.known_plates)
+        return self._matrix.match_many(plates, 1 if self.tolerate_one_mistake else 0)
+
+    def _match_many_weighted(self, plates: List[str]) -> BatchMatch:
+        """Return match() of every plate as a batch."""
+        registry = tuple(self.known_plates)
+        positions = {known: position for position, known in enumerate(registry)}
+        matches = [self.match(plate) for plate in plates]
+        return BatchMatch(
+            np.array([positions[m.plate] if m.known else -1 for m in matches], dtype=np.int64),
+            np.array([m.distance if m.known else -1 for m in matches], dtype=np.float64),
+            np.array([m.ambiguous for m in matches], dtype=bool),
+            registry,
+        )
+
+    def match_candidates(self, results: List[Dict[str, Any]]) -> List[Optional[CandidateMatch]]:
+        """Match every candidate reading of every result in one batch.
+
+        Readings are the API candidates of a result, with its top plate first
+        if missing. Per result the registry hit with the lowest distance wins,
+        then the highest candidate score, then the best rank; results without
+        any hit give None.
+        """
+        readings = [_readings(result) for result in results]
+        unique = list(dict.fromkeys(plate for reading in readings for plate, _ in reading))
+        found: Dict[str, Tuple[Any, float, bool]] = {}
+        if unique and self._weighted is None and len(unique) >= MATRIX_MIN_BATCH:
+            batch = self.match_many(unique)
+            for plate, index, distance, ambiguous in zip(unique, batch.indices, batch.distances, batch.ambiguous):
+                if index >= 0:
+                    found[plate] = (batch.registry[index], distance.item(), bool(ambiguous))
+        else:
+            for plate in unique:
+                match = self.match(plate)
+                if match.known:
+                    found[plate] = (match.plate, match.distance, match.ambiguous)
+
+        matches: List[Optional[CandidateMatch]] = []
+        for reading in readings:
+            hits = [
+                (found[plate][1], -score, rank, plate, score)
+                for rank, (plate, score) in enumerate(reading)
+                if plate in found
+            ]
+            if not hits:
+                matches.append(None)
+                continue
+            distance, _, rank, plate, score = min(hits)
+            known, _, ambiguous = found[plate]
+            matches.append(CandidateMatch(
+                plate, rank, score, known, self.known_plates[known], distance, ambiguous
+            ))
+        return matches
+
     def get_plate_owner(self, plate: str) -> str:
         """Return plate owner."""
+        if self._weighted is not None:
+            match = self.match(plate)
+            return match.owner if match.known else "Unknown"
         if self.tolerate_one_mistake:
-            for known_plate in self.known_plates:
-                if self._plates_similar(plate, known_plate):
-                    return self.known_plates[known_plate]
+            known_plate = self._index.first_similar(plate)
+            if known_plate is not None:
+                return self.known_plates[known_plate]
         return self.known_plates.get(plate.upper(), "Unknown")
 
     def _plates_similar(self, plate1: str, plate2: str) -> bool:
-        """Check if plates are similar (tolerance of 1 error)."""
+        """Check if plates are similar (tolerance of 1 error, or the weighted cost threshold)."""
+        if self._weighted is not None:
+            return self._weighted.within(plate1, plate2)
         if len(plate1) != len(plate2):
             return False
         differences = sum(1 for a, b in zip(plate1.upper(), plate2.upper()) if a != b)
@@ -291,10 +550,11 @@ class PlateManager:
         if plate.upper() in self.known_plates:
             return True
         
+        if self._weighted is not None:
+            return self.match(plate).known
+
         if self.tolerate_one_mistake:
-            for known_plate in self.known_plates:
-                if self._plates_similar(plate, known_plate):
-                    return True
+            return self._index.first_similar(plate) is not None
         
         return False
 
@@ -317,11 +577,15 @@ class PlateManager:
         if plate_upper in self.known_plates:
             return plate_upper  # Return original if exact match
         
+        if self._weighted is not None:
+            match = self.match(plate_upper)
+            return match.plate if match.known else plate
+
         if self.tolerate_one_mistake:
-            for known_plate in self.known_plates:
-                if self._plates_similar(plate_upper, known_plate):
-                    # Found similar plate, return the one from .yaml file
-                    return known_plate
+            known_plate = self._index.first_similar(plate_upper)
+            if known_plate is not None:
+                # Found similar plate, return the one from .yaml file
+                return known_plate
         
         # If no similar found, return original plate
         return plate
@@ -0,0 +1,198 @@
+"""Vectorized batch matching of plates against the registry."""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Budget for one (queries x registry x length) block of the brute force path
+MAX_BLOCK_BYTES = 64 * 1024 * 1024
+
+# Code for query characters absent from the registry, never equal to a registry code.
+# Also masks one position in packed wildcard keys, like WILDCARD in plate_index.
+UNKNOWN_CODE = 0
+
+# Packed keys are int64, so base ** length must stay below this
+MAX_PACKED = 2 ** 63
+
+
+class BatchMatch(NamedTuple):
+    """Best registry match of every plate of a batch.
+
+    indices[i] is the position of the best match of plates[i] in registry,
+    or -1 without a match; distances[i] is its Hamming distance, or -1;
+    ambiguous[i] is True when several registry plates tie for the best match.
+    """
+
+    indices: np.ndarray
+    distances: np.ndarray
+    ambiguous: np.ndarray
+    registry: Tuple[Any, ...]
+
+
+class _Bucket:
+    """Registry plates of one length as a matrix of character codes.
+
+    Rows are sorted like the scalar matcher breaks ties (alphabetically), so
+    the lowest row at minimal distance is the match match() would pick.
+    """
+
+    def __init__(self, matrix: np.ndarray, positions: np.ndarray, base: int):
+        """Initialize bucket."""
+        self.matrix = matrix
+        self.positions = positions
+        length = matrix.shape[1]
+        self.weights: Optional[np.ndarray] = None
+        self._sorted: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        if base ** length < MAX_PACKED:
+            self.weights = np.array([base ** (length - 1 - position) for position in range(length)], dtype=np.int64)
+
+    def pack(self, matrix: np.ndarray) -> np.ndarray:
+        """Return every row packed into one int64 key."""
+        return matrix.astype(np.int64) @ self.weights
+
+    def sorted_keys(self, position: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return sorted keys with position masked (-1 for none) and their rows."""
+        if position not in self._sorted:
+            keys = self.pack(self.matrix)
+            if position >= 0:
+                keys -= self.matrix[:, position].astype(np.int64) * self.weights[position]
+            # Stable sort keeps rows of equal keys in tie-break order
+            order = np.argsort(keys, kind="stable").astype(np.int32)
+            self._sorted[position] = (keys[order], order)
+        return self._sorted[position]
+
+
+class PlateMatrix:
+    """Registry stored as one fixed-width code matrix per plate length.
+
+    Exact and one-mistake batches are answered with the wildcard idea of
+    PlateIndex in vectorized form: each row is packed into an integer key,
+    keys with one position masked are sorted once, and a whole batch is
+    resolved with binary searches. Larger tolerances fall back to broadcast
+    Hamming distances over the bucket.
+    """
+
+    def __init__(self, plates: Iterable[Any] = ()):
+        """Initialize matrix."""
+        self.rebuild(plates)
+
+    def rebuild(self, plates: Iterable[Any]) -> None:
+        """Rebuild buckets from registry plates."""
+        self._registry = tuple(plates)
+        names = [str(plate) for plate in self._registry]
+        keys = [name.upper() for name in names]
+        lengths = np.fromiter(map(len, keys), dtype=np.int64, count=len(keys))
+
+        # Code of a character is its rank among registry characters, plus one
+        self._points = np.array(sorted(ord(char) for char in set("".join(keys))), dtype=np.uint32)
+        # Plates use a few dozen characters; wider codes only for unusual registries
+        self._dtype = np.uint8 if len(self._points) < 256 else np.uint32
+        base = len(self._points) + 1
+
+        self._buckets: Dict[int, _Bucket] = {}
+        for length in np.unique(lengths).tolist():
+            positions = np.flatnonzero(lengths == length)
+            # Stable, so equal names keep registry order like the scalar sort
+            positions = positions[np.argsort(np.array([names[position] for position in positions]), kind="stable")]
+            matrix = self._encode([keys[position] for position in positions], length)
+            self._buckets[length] = _Bucket(matrix, positions, base)
+
+    def __len__(self) -> int:
+        """Return number of registry plates."""
+        return len(self._registry)
+
+    def _encode(self, keys: Sequence[str], length: int) -> np.ndarray:
+        """Return keys of one length as a matrix of character codes."""
+        if not length or not len(self._points):
+            return np.full((len(keys), length), UNKNOWN_CODE, dtype=self._dtype)
+        points = np.array(keys, dtype=f"<U{length}").view(np.uint32).reshape(len(keys), length)
+        ranks = np.searchsorted(self._points, points)
+        known = self._points[np.minimum(ranks, len(self._points) - 1)] == points
+        return np.where(known, ranks + 1, UNKNOWN_CODE).astype(self._dtype)
+
+    def match_many(self, plates: Sequence[str], max_distance: int) -> BatchMatch:
+        """Return the best match within max_distance of every plate."""
+        indices = np.full(len(plates), -1, dtype=np.int64)
+        distances = np.full(len(plates), -1, dtype=np.int64)
+        ambiguous = np.zeros(len(plates), dtype=bool)
+
+        queries_by_length: Dict[int, List[int]] = {}
+        keys = [plate.upper() for plate in plates]
+        for query, key in enumerate(keys):
+            queries_by_length.setdefault(len(key), []).append(query)
+
+        for length, queries in queries_by_length.items():
+            bucket = self._buckets.get(length)
+            if bucket is None:
+                continue
+            encoded = self._encode([keys[query] for query in queries], length)
+            if bucket.weights is not None and max_distance <= 1:
+                rows, distance, ties = self._search(bucket, encoded, max_distance)
+            else:
+                rows, distance, ties = self._scan(bucket, encoded, max_distance)
+
+            found = rows >= 0
+            query_rows = np.asarray(queries, dtype=np.int64)[found]
+            indices[query_rows] = bucket.positions[rows[found]]
+            distances[query_rows] = distance[found]
+            ambiguous[query_rows] = ties[found]
+
+        return BatchMatch(indices, distances, ambiguous, self._registry)
+
+    @staticmethod
+    def _search(bucket: _Bucket, encoded: np.ndarray, max_distance: int):
+        """Resolve exact and one-mistake queries by binary search of packed keys."""
+        count = len(encoded)
+        packed = bucket.pack(encoded)
+
+        sorted_keys, order = bucket.sorted_keys(-1)
+        low = np.searchsorted(sorted_keys, packed, "left")
+        matches = np.searchsorted(sorted_keys, packed, "right") - low
+        exact = matches > 0
+        rows = np.full(count, -1, dtype=np.int64)
+        rows[exact] = order[low[exact]]
+        distance = np.zeros(count, dtype=np.int64)
+        ties = matches > 1
+        if max_distance < 1:
+            return rows, distance, ties
+
+        # A plate one mistake away shares exactly one masked key with the query,
+        # an exact plate shares all of them
+        best = np.full(count, len(bucket.matrix), dtype=np.int64)
+        similar = np.zeros(count, dtype=np.int64)
+        for position in range(encoded.shape[1]):
+            sorted_keys, order = bucket.sorted_keys(position)
+            masked = packed - encoded[:, position].astype(np.int64) * bucket.weights[position]
+            low = np.searchsorted(sorted_keys, masked, "left")
+            shared = np.searchsorted(sorted_keys, masked, "right") - low
+            hit = shared > 0
+            best[hit] = np.minimum(best[hit], order[low[hit]])
+            similar += shared
+
+        one_mistake = ~exact & (similar > 0)
+        rows[one_mistake] = best[one_mistake]
+        distance[one_mistake] = 1
+        ties[one_mistake] = similar[one_mistake] > 1
+        return rows, distance, ties
+
+    @staticmethod
+    def _scan(bucket: _Bucket, encoded: np.ndarray, max_distance: int):
+        """Compute broadcast Hamming distances against the whole bucket."""
+        matrix = bucket.matrix
+        rows = np.full(len(encoded), -1, dtype=np.int64)
+        distance = np.full(len(encoded), -1, dtype=np.int64)
+        ties = np.zeros(len(encoded), dtype=bool)
+
+        # Compare in blocks so queries x registry x length stays bounded
+        block = max(1, MAX_BLOCK_BYTES // max(1, matrix.shape[0] * matrix.shape[1]))
+        for start in range(0, len(encoded), block):
+            chunk = encoded[start:start + block]
+            distances = (chunk[:, None, :] != matrix[None, :, :]).sum(axis=2, dtype=np.uint16)
+            best = distances.argmin(axis=1)
+            best_distance = distances[np.arange(len(chunk)), best].astype(np.int64)
+            found = best_distance <= max_distance
+            window = slice(start, start + len(chunk))
+            rows[window] = np.where(found, best, -1)
+            distance[window] = best_distance
+            ties[window] = (distances == distances[np.arange(len(chunk)), best][:, None]).sum(axis=1) > 1
+        return rows, distance, ties
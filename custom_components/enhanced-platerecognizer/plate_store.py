@@ -0,0 +1,320 @@
+"""Persistent storage backends for the plate registry."""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+from functools import partial
+from typing import Dict, Optional, Union
+
+import aiofiles
+import aiofiles.os
+import yaml
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+CONF_REGISTRY = "registry"
+CONF_REGISTRY_SAVE_DELAY = "registry_save_delay"
+REGISTRY_YAML = "yaml"
+REGISTRY_SQLITE = "sqlite"
+
+PLATES_YAML = "plates.yaml"
+PLATES_DB = "plates.db"
+JOURNAL_SUFFIX = ".journal"
+
+# Seconds of edits folded into one plates.yaml rewrite
+DEFAULT_SAVE_DELAY = 5.0
+
+# libyaml bindings are several times faster on large registries
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Bumped once plates.yaml has been imported into a new database
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS plates (
+    plate TEXT PRIMARY KEY,
+    owner TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS plates_owner ON plates (owner);
+"""
+
+
+def _read_yaml(content: str) -> Dict[str, str]:
+    """Return plates of a plates.yaml document."""
+    if not content.strip():  # Empty file
+        return {}
+    data = yaml.load(content, Loader=YAML_LOADER)
+    if data is None:  # Invalid YAML
+        return {}
+    return data.get('plates', {}) or {}
+
+
+def write_atomic(path: str, content: str) -> None:
+    """Replace path with content so readers see the old or the new file, never a partial one."""
+    temporary = f"{path}.tmp"
+    with open(temporary, 'w', encoding='utf-8') as file:
+        file.write(content)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+def _replay_journal(content: str, plates: Dict[str, str]) -> int:
+    """Apply journal entries to plates and return how many were applied."""
+    replayed = 0
+    for line in content.splitlines():
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            # Only the last line can be cut short by a crash
+            _LOGGER.warning(f"Skipping damaged plates journal entry: {line!r}")
+            continue
+        if entry.get('owner') is None:
+            plates.pop(entry['plate'], None)
+        else:
+            plates[entry['plate']] = entry['owner']
+        replayed += 1
+    return replayed
+
+
+class YamlPlateStore:
+    """Registry kept in plates.yaml with a write-behind journal.
+
+    Every change is appended to plates.yaml.journal at once, which costs the
+    same whatever the registry size. Changes arriving within snapshot_delay
+    seconds are folded into one atomic rewrite of plates.yaml, after which
+    the journal is emptied. Journal entries left by a crash are replayed
+    over plates.yaml on load.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str, snapshot_delay: float = DEFAULT_SAVE_DELAY):
+        """Initialize store."""
+        self.hass = hass
+        self.path = path
+        self.journal_path = f"{path}{JOURNAL_SUFFIX}"
+        self._snapshot_delay = snapshot_delay
+        self._plates: Dict[str, str] = {}
+        self._journal_bytes = 0
+        self._unsub_snapshot = None
+        # Serializes journal appends and truncation; snapshots are serialized separately
+        self._journal_lock = asyncio.Lock()
+        self._snapshot_lock = asyncio.Lock()
+
+    async def async_load(self) -> Dict[str, str]:
+        """Return all plates, replaying the journal and creating an empty file if needed."""
+        plates: Dict[str, str] = {}
+        exists = await aiofiles.os.path.exists(self.path)
+        if exists:
+            async with aiofiles.open(self.path, 'r', encoding='utf-8') as file:
+                plates = _read_yaml(await file.read())
+
+        replayed = 0
+        if await aiofiles.os.path.exists(self.journal_path):
+            async with aiofiles.open(self.journal_path, 'rb') as file:
+                content = await file.read()
+            replayed = _replay_journal(content.decode('utf-8', errors='replace'), plates)
+            # The whole journal is covered by the snapshot written below
+            self._journal_bytes = len(content)
+
+        self._plates = plates
+        if replayed:
+            _LOGGER.info(f"Replayed {replayed} journaled change(s) over {self.path}")
+        if self._journal_bytes or not exists:
+            await self._async_snapshot(force=True)
+        return plates
+
+    async def async_apply(self, plates: Dict[str, str], changes: Dict[str, Optional[str]]) -> None:
+        """Journal changes (plate to owner, None when removed) and schedule a snapshot."""
+        self._plates = plates
+        if not changes:
+            return
+        lines = "".join(
+            json.dumps({'plate': plate, 'owner': owner}, ensure_ascii=False) + "\n"
+            for plate, owner in changes.items()
+        )
+        async with self._journal_lock:
+            async with aiofiles.open(self.journal_path, 'a', encoding='utf-8') as file:
+                await file.write(lines)
+            self._journal_bytes += len(lines.encode('utf-8'))
+
+        # The window starts with the first change, so steady edits still get saved
+        if self._unsub_snapshot is None:
+            self._unsub_snapshot = async_call_later(self.hass, self._snapshot_delay, self._handle_snapshot_timer)
+
+    async def _handle_snapshot_timer(self, _now) -> None:
+        """Write the snapshot once the debounce window has passed."""
+        self._unsub_snapshot = None
+        try:
+            await self._async_snapshot()
+        except Exception as e:
+            _LOGGER.error(f"Error saving plates snapshot: {e}")
+
+    async def _async_snapshot(self, force: bool = False) -> None:
+        """Atomically rewrite plates.yaml and drop the journal entries it covers."""
+        async with self._snapshot_lock:
+            async with self._journal_lock:
+                covered = self._journal_bytes
+                plates = dict(self._plates)
+            if not covered and not force:
+                return
+
+            content = await self.hass.async_add_executor_job(
+                partial(yaml.dump, {'plates': plates}, Dumper=YAML_DUMPER, default_flow_style=False, allow_unicode=True)
+            )
+            await self.hass.async_add_executor_job(write_atomic, self.path, content)
+
+            async with self._journal_lock:
+                await self.hass.async_add_executor_job(self._drop_journal_head, covered)
+                self._journal_bytes -= covered
+            _LOGGER.debug(f"Saved {len(plates)} plates to {self.path}")
+
+    def _drop_journal_head(self, size: int) -> None:
+        """Remove the first size bytes of the journal, keeping later entries."""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'rb') as file:
+            file.seek(size)
+            tail = file.read()
+        if tail:
+            temporary = f"{self.journal_path}.tmp"
+            with open(temporary, 'wb') as file:
+                file.write(tail)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, self.journal_path)
+        else:
+            os.remove(self.journal_path)
+
+    async def async_close(self) -> None:
+        """Write pending changes before shutdown."""
+        if self._unsub_snapshot is not None:
+            self._unsub_snapshot()
+            self._unsub_snapshot = None
+        await self._async_snapshot()
+
+
+class SqlitePlateStore:
+    """Registry kept in an SQLite database in WAL mode.
+
+    Changes are written as one transaction touching only the changed rows,
+    so an edit costs the same for 50 or 50,000 plates. A new database
+    imports plates.yaml once if it exists; the YAML file is left in place.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str, yaml_path: Optional[str] = None):
+        """Initialize store."""
+        self.hass = hass
+        self.path = path
+        self.yaml_path = yaml_path
+        self._connection: Optional[sqlite3.Connection] = None
+        # Executor jobs run on any worker thread, one at a time per connection
+        self._lock = threading.Lock()
+        # Hands jobs to the executor one by one, so writes commit in submission order
+        self._queue = asyncio.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection, opening and migrating the database if needed."""
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            try:
+                if connection.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                    self._import_yaml(connection)
+            except BaseException:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    def _import_yaml(self, connection: sqlite3.Connection) -> None:
+        """Copy plates.yaml into a new database in one transaction."""
+        plates: Dict[str, str] = {}
+        if self.yaml_path and os.path.exists(self.yaml_path):
+            with open(self.yaml_path, encoding='utf-8') as file:
+                plates = _read_yaml(file.read())
+        # Changes not yet folded into plates.yaml
+        journal_path = f"{self.yaml_path}{JOURNAL_SUFFIX}" if self.yaml_path else None
+        if journal_path and os.path.exists(journal_path):
+            with open(journal_path, encoding='utf-8') as file:
+                _replay_journal(file.read(), plates)
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "INSERT OR REPLACE INTO plates (plate, owner) VALUES (?, ?)",
+                ((str(plate), str(owner)) for plate, owner in plates.items()),
+            )
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if plates:
+            _LOGGER.info(f"Imported {len(plates)} plates from {self.yaml_path} into {self.path}")
+
+    def _load(self) -> Dict[str, str]:
+        """Return all plates ordered like plates.yaml."""
+        with self._lock:
+            rows = self._connect().execute("SELECT plate, owner FROM plates ORDER BY plate")
+            return dict(rows.fetchall())
+
+    def _apply(self, changes: Dict[str, Optional[str]]) -> None:
+        """Write changes in a single transaction."""
+        upserts = [(plate, owner) for plate, owner in changes.items() if owner is not None]
+        removals = [(plate,) for plate, owner in changes.items() if owner is None]
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT INTO plates (plate, owner) VALUES (?, ?) "
+                    "ON CONFLICT (plate) DO UPDATE SET owner = excluded.owner",
+                    upserts,
+                )
+                connection.executemany("DELETE FROM plates WHERE plate = ?", removals)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def _close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    async def async_load(self) -> Dict[str, str]:
+        """Return all plates."""
+        async with self._queue:
+            return await self.hass.async_add_executor_job(self._load)
+
+    async def async_apply(self, plates: Dict[str, str], changes: Dict[str, Optional[str]]) -> None:
+        """Persist changes (plate to owner, None when removed)."""
+        if changes:
+            async with self._queue:
+                await self.hass.async_add_executor_job(self._apply, changes)
+
+    async def async_close(self) -> None:
+        """Close the database."""
+        async with self._queue:
+            await self.hass.async_add_executor_job(self._close)
+
+
+def plate_store_from_config(hass: HomeAssistant, config: Dict) -> Union[YamlPlateStore, SqlitePlateStore]:
+    """Return the registry store selected by the domain config."""
+    backend = config.get(CONF_REGISTRY, REGISTRY_YAML)
+    yaml_path = hass.config.path(PLATES_YAML)
+    if backend == REGISTRY_YAML:
+        return YamlPlateStore(hass, yaml_path, config.get(CONF_REGISTRY_SAVE_DELAY, DEFAULT_SAVE_DELAY))
+    if backend == REGISTRY_SQLITE:
+        return SqlitePlateStore(hass, hass.config.path(PLATES_DB), yaml_path)
+    raise ValueError(f"Unknown registry '{backend}', expected '{REGISTRY_YAML}' or '{REGISTRY_SQLITE}'")
@@ -0,0 +1,243 @@
+"""Offline replay of stored snapshots through the recognition pipeline."""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import aiofiles
+
+from homeassistant.core import HomeAssistant
+
+from .consensus import fuse_results
+from .image_preprocessing import load_and_preprocess
+from .latency import ScanTrace
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "enhanced_platerecognizer"
+
+EVENT_REPLAY_FINISHED = "enhanced_platerecognizer_replay_finished"
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+DEFAULT_REPLAY_WORKERS = 2
+DEFAULT_PASSAGE_GAP = 5.0  # seconds between snapshots of one vehicle passage
+
+
+def list_images(folder: Path, limit: Optional[int] = None) -> List[Path]:
+    """Return image files in folder ordered by modification time."""
+    paths = [path for path in folder.iterdir() if path.suffix.lower() in IMAGE_EXTENSIONS]
+    paths.sort(key=lambda path: (path.stat().st_mtime, path.name))
+    return paths[:limit] if limit else paths
+
+
+def load_labels(path: Optional[Path]) -> Dict[str, str]:
+    """Return expected plates by file name from a JSON object, if given."""
+    if path is None:
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return {name: plate.upper() for name, plate in json.load(file).items()}
+
+
+def group_passages(paths: List[Path], gap: float) -> List[List[Path]]:
+    """Split time-ordered snapshots into passages separated by more than gap seconds."""
+    passages: List[List[Path]] = []
+    last_mtime = None
+    for path in paths:
+        mtime = path.stat().st_mtime
+        if last_mtime is None or mtime - last_mtime > gap:
+            passages.append([])
+        passages[-1].append(path)
+        last_mtime = mtime
+    return passages
+
+
+class ReplayStats:
+    """Aggregate accuracy and throughput of a replay."""
+
+    def __init__(self):
+        """Initialize counters."""
+        self.images = 0
+        self.errors = 0
+        self.with_plates = 0
+        self.known = 0
+        self.ambiguous = 0
+        self.uploads = 0
+        self.labelled = 0
+        self.correct = 0
+        self.passages = 0
+        self.passages_correct = 0
+        self.passages_labelled = 0
+        self._start = time.perf_counter()
+
+    def add_image(self, record: Dict[str, Any]) -> None:
+        """Count one image record."""
+        self.images += 1
+        if "error" in record:
+            self.errors += 1
+            return
+        self.uploads += record["uploaded"]
+        if record["plates"]:
+            self.with_plates += 1
+        self.known += sum(1 for plate in record["plates"] if plate["known"])
+        self.ambiguous += sum(1 for plate in record["plates"] if plate["ambiguous"])
+        if "expected" in record:
+            self.labelled += 1
+            self.correct += record["correct"]
+
+    def add_passage(self, record: Dict[str, Any]) -> None:
+        """Count one fused passage record."""
+        self.passages += 1
+        if "expected" in record:
+            self.passages_labelled += 1
+            self.passages_correct += record["correct"]
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """Return aggregate numbers."""
+        elapsed = time.perf_counter() - self._start
+        summary = {
+            "images": self.images,
+            "errors": self.errors,
+            "images_with_plates": self.with_plates,
+            "known_plates": self.known,
+            "ambiguous_matches": self.ambiguous,
+            "uploads": self.uploads,
+            "elapsed_s": round(elapsed, 2),
+            "images_per_second": round(self.images / elapsed, 2) if elapsed else None,
+        }
+        if self.labelled:
+            summary["accuracy"] = round(self.correct / self.labelled, 4)
+        if self.passages:
+            summary["passages"] = self.passages
+        if self.passages_labelled:
+            summary["passage_accuracy"] = round(self.passages_correct / self.passages_labelled, 4)
+        return summary
+
+
+def _match_plates(plate_manager, results: List[Dict]) -> List[Dict[str, Any]]:
+    """Return registry matches of every result, over all its candidates in one batch."""
+    results = [result for result in results if "plate" in result]
+    plates = [
+        {"plate": result["plate"].upper(), "score": result.get("score"), "known": False, "ambiguous": False}
+        for result in results
+    ]
+    if plate_manager is None or not plates:
+        return plates
+
+    for entry, match in zip(plates, plate_manager.match_candidates(results)):
+        if match is None:
+            entry.update({"registry_plate": None, "owner": None, "distance": None})
+            continue
+        entry.update({
+            "known": True,
+            "registry_plate": match.plate,
+            "owner": match.owner,
+            "distance": match.distance,
+            "ambiguous": match.ambiguous,
+            "candidate": match.candidate,
+            "candidate_rank": match.rank,
+        })
+    return plates
+
+
+def _is_correct(plates: List[Dict[str, Any]], expected: str) -> bool:
+    """Return True if the expected plate was read or matched."""
+    return any(expected in (plate["plate"], plate.get("registry_plate")) for plate in plates)
+
+
+async def async_replay(
+    hass: HomeAssistant,
+    entity,
+    folder: Path,
+    output: Path,
+    workers: int = DEFAULT_REPLAY_WORKERS,
+    labels: Optional[Path] = None,
+    limit: Optional[int] = None,
+    passage_gap: float = DEFAULT_PASSAGE_GAP,
+) -> Dict[str, Any]:
+    """Replay snapshots in folder through entity's pipeline.
+
+    Images are decoded and preprocessed on a process pool, then answered
+    from the result cache or uploaded through the shared scheduler, parsed
+    and matched against the current registry. No image processed events
+    are fired, so automations are not triggered. One JSONL record per image
+    (and per passage with consensus) is written to output; the aggregate is
+    returned.
+    """
+    paths = await hass.async_add_executor_job(list_images, folder, limit)
+    expected = await hass.async_add_executor_job(load_labels, labels)
+    plate_manager = hass.data.get(DOMAIN, {}).get("plate_manager")
+    max_edge, greyscale, jpeg_quality, roi = entity.preprocess_options
+    stats = ReplayStats()
+    results_by_path: Dict[Path, List[Dict]] = {}
+
+    async def replay_one(pool, path: Path) -> Dict[str, Any]:
+        record: Dict[str, Any] = {"type": "image", "file": path.name}
+        trace = ScanTrace()
+        try:
+            width, height, prepared = await asyncio.get_running_loop().run_in_executor(
+                pool, load_and_preprocess, path, max_edge, greyscale, jpeg_quality, roi
+            )
+            results, _, backend = await entity.async_recognize_prepared(prepared, width, height, trace)
+        except Exception as exc:
+            record["error"] = str(exc)
+            return record
+        results_by_path[path] = results
+        record.update({
+            "width": width,
+            "height": height,
+            "uploaded": backend is not None,
+            "plates": _match_plates(plate_manager, results),
+            "elapsed_ms": round(trace.elapsed_ms(), 1),
+        })
+        if path.name in expected:
+            record["expected"] = expected[path.name]
+            record["correct"] = _is_correct(record["plates"], expected[path.name])
+        return record
+
+    context = multiprocessing.get_context("spawn")
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    try:
+        async with aiofiles.open(output, "w", encoding="utf-8") as file:
+            # Keep a few images per worker in flight so uploads overlap decoding
+            batch = max(1, workers * 2)
+            for start in range(0, len(paths), batch):
+                chunk = paths[start:start + batch]
+                records = await asyncio.gather(*(replay_one(pool, path) for path in chunk))
+                for record in records:
+                    stats.add_image(record)
+                    await file.write(json.dumps(record) + "\n")
+
+            if entity.consensus:
+                passages = await hass.async_add_executor_job(group_passages, paths, passage_gap)
+                for passage in passages:
+                    frames = [results_by_path[path] for path in passage if path in results_by_path]
+                    fused = fuse_results(frames)
+                    record = {
+                        "type": "passage",
+                        "files": [path.name for path in passage],
+                        "plates": _match_plates(plate_manager, fused),
+                    }
+                    labels_seen = [expected[path.name] for path in passage if path.name in expected]
+                    if labels_seen:
+                        record["expected"] = labels_seen[0]
+                        record["correct"] = _is_correct(record["plates"], labels_seen[0])
+                    stats.add_passage(record)
+                    await file.write(json.dumps(record) + "\n")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    summary = stats.summary
+    _LOGGER.info(f"Replay of {folder} for {entity.entity_id} finished: {summary}")
+    hass.bus.async_fire(EVENT_REPLAY_FINISHED, {
+        "entity_id": entity.entity_id,
+        "folder": str(folder),
+        "output": str(output),
+        **summary,
+    })
+    return summary
@@ -0,0 +1,78 @@
+"""Content-addressed cache of Plate Recognizer responses."""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_CACHE_SIZE = 1024  # kilobytes
+DEFAULT_CACHE_TTL = 0  # seconds, 0 disables the cache
+
+
+class ResultCache:
+    """LRU cache with TTL and memory bound for recognition responses.
+
+    Entries are keyed on a hash of the uploaded bytes plus the request
+    parameters, so byte-identical snapshots are answered without an API call.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        """Initialize cache."""
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(image, params: str) -> str:
+        """Return cache key for uploaded image and request parameters."""
+        digest = hashlib.blake2b(image, digest_size=20)
+        digest.update(params.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return cached response or None."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] > self._ttl:
+            self._evict(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(entry[2])
+
+    def put(self, key: str, response: Dict[str, Any]) -> None:
+        """Store response, evicting least recently used entries over the bound."""
+        # Usage counters belong to the call that produced them
+        response = {k: v for k, v in response.items() if k != "usage"}
+        size = len(key) + len(json.dumps(response))
+        if size > self._max_bytes:
+            return
+        if key in self._entries:
+            self._evict(key)
+        self._entries[key] = (time.monotonic(), size, response)
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, key: str) -> None:
+        """Remove entry."""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
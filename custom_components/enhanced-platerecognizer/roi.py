@@ -0,0 +1,77 @@
+"""Per-camera region of interest."""
+
+import math
+from typing import Any, Dict, List, Sequence, Tuple
+
+Point = Tuple[float, float]
+
+
+def _shape_to_polygon(shape: Dict[str, Any]) -> List[Point]:
+    """Return normalized polygon for a rectangle or polygon shape."""
+    if "polygon" in shape:
+        return [(float(x), float(y)) for x, y in shape["polygon"]]
+    x_min, y_min = shape["x_min"], shape["y_min"]
+    x_max, y_max = shape["x_max"], shape["y_max"]
+    return [(x_min, y_min), (x_max, y_min), (x_max, y_max), (x_min, y_max)]
+
+
+def _point_in_polygon(x: float, y: float, polygon: Sequence[Point]) -> bool:
+    """Ray casting test, points on the edge count as inside."""
+    inside = False
+    count = len(polygon)
+    for i in range(count):
+        x1, y1 = polygon[i]
+        x2, y2 = polygon[(i + 1) % count]
+        if min(x1, x2) <= x <= max(x1, x2) and min(y1, y2) <= y <= max(y1, y2):
+            # Point on a (non-degenerate) edge
+            if math.isclose((x2 - x1) * (y - y1), (y2 - y1) * (x - x1), abs_tol=1e-9):
+                return True
+        if (y1 > y) != (y2 > y):
+            crossing = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            if x < crossing:
+                inside = not inside
+    return inside
+
+
+class RegionOfInterest:
+    """Union of normalized rectangles and polygons within a camera frame."""
+
+    def __init__(self, shapes: List[Dict[str, Any]]):
+        """Initialize region from configured shapes."""
+        self._polygons = [_shape_to_polygon(shape) for shape in shapes]
+        xs = [x for polygon in self._polygons for x, _ in polygon]
+        ys = [y for polygon in self._polygons for _, y in polygon]
+        self._bounds = (
+            max(0.0, min(xs)),
+            max(0.0, min(ys)),
+            min(1.0, max(xs)),
+            min(1.0, max(ys)),
+        )
+
+    def crop_box(self, width: int, height: int) -> Tuple[int, int, int, int]:
+        """Return pixel bounding box (left, top, right, bottom) of the region."""
+        x_min, y_min, x_max, y_max = self._bounds
+        left = int(math.floor(x_min * width))
+        top = int(math.floor(y_min * height))
+        right = max(left + 1, int(math.ceil(x_max * width)))
+        bottom = max(top + 1, int(math.ceil(y_max * height)))
+        return left, top, right, bottom
+
+    def contains(self, x: float, y: float, width: int, height: int) -> bool:
+        """Return True if pixel point lies within any shape of the region."""
+        point_x, point_y = x / width, y / height
+        return any(_point_in_polygon(point_x, point_y, polygon) for polygon in self._polygons)
+
+    def filter_results(self, results: List[Dict], width: int, height: int) -> List[Dict]:
+        """Drop results whose box centre lies outside the region."""
+        kept = []
+        for result in results:
+            box = result.get("box")
+            if box is None:
+                kept.append(result)
+                continue
+            x_centre = box["xmin"] + (box["xmax"] - box["xmin"]) / 2
+            y_centre = box["ymin"] + (box["ymax"] - box["ymin"]) / 2
+            if self.contains(x_centre, y_centre, width, height):
+                kept.append(result)
+        return kept
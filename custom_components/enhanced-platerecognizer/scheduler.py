@@ -0,0 +1,246 @@
+"""Shared scan scheduler for all Plate Recognizer entities."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, callback
+
+from .api_client import RateLimitedError
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "enhanced_platerecognizer"
+
+DEFAULT_MAX_IN_FLIGHT = 4
+MAX_RATE_LIMIT_RETRIES = 3
+
+
+class TokenBucket:
+    """Token bucket limiting uploads for one API token."""
+
+    def __init__(self, rate: Optional[float], burst: int):
+        """Initialize bucket, rate None means unlimited."""
+        self._rate = rate
+        self._capacity = max(1, burst)
+        self._tokens = float(self._capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens earned since last update."""
+        if self._rate:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Return seconds until an upload may start."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if not self._rate:
+            return 0.0
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self._rate
+
+    def take(self, now: float) -> None:
+        """Consume one token."""
+        if self._rate:
+            self._refill(now)
+            self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Hold all uploads for seconds, e.g. after a 429."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class _ScanJob:
+    """Upload waiting for its turn."""
+
+    __slots__ = ("camera", "token", "upload", "future", "submitted", "attempts")
+
+    def __init__(self, camera: str, token: str, upload: Callable[[], Awaitable[Any]]):
+        self.camera = camera
+        self.token = token
+        self.upload = upload
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.submitted = time.monotonic()
+        self.attempts = 0
+
+
+class ScanScheduler:
+    """Global upload scheduler.
+
+    Uploads of all cameras pass through here. Cameras are served round-robin,
+    at most max_in_flight uploads run at once, each API token is limited by a
+    token bucket and a 429 pauses that token for its Retry-After.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        rate: Optional[float] = None,
+        burst: int = 1,
+    ):
+        """Initialize scheduler."""
+        self.hass = hass
+        self._max_in_flight = max_in_flight
+        self._rate = rate
+        self._burst = burst
+        self._queues: "OrderedDict[str, Deque[_ScanJob]]" = OrderedDict()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._wakeup = asyncio.Event()
+        self._dispatcher = None
+        self._in_flight = 0
+        self.completed = 0
+        self.rate_limited = 0
+        self.last_wait_ms = None
+        self.max_wait_ms = 0.0
+        self._total_wait_ms = 0.0
+        self._dispatched = 0
+
+    @callback
+    def async_start(self) -> None:
+        """Start the dispatcher."""
+        self._dispatcher = self.hass.async_create_background_task(
+            self._async_dispatch(), f"{DOMAIN} scan scheduler"
+        )
+
+    @callback
+    def async_stop(self, event=None) -> None:
+        """Stop the dispatcher and fail queued uploads."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        for queue in self._queues.values():
+            for job in queue:
+                if not job.future.done():
+                    job.future.cancel()
+        self._queues.clear()
+
+    async def async_submit(
+        self, camera: str, token: str, upload: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Queue upload for camera and return its result once it ran."""
+        job = _ScanJob(camera, token, upload)
+        self._queues.setdefault(camera, deque()).append(job)
+        self._wakeup.set()
+        return await job.future
+
+    def _bucket(self, token: str) -> TokenBucket:
+        """Return token bucket for API token."""
+        bucket = self._buckets.get(token)
+        if bucket is None:
+            bucket = self._buckets[token] = TokenBucket(self._rate, self._burst)
+        return bucket
+
+    def _next_job(self):
+        """Return (job, None) to start now or (None, seconds to wait)."""
+        if self._in_flight >= self._max_in_flight:
+            return None, None
+
+        now = time.monotonic()
+        shortest_wait = None
+        for camera in list(self._queues):
+            queue = self._queues[camera]
+            while queue and queue[0].future.done():
+                queue.popleft()  # Caller gave up
+            if not queue:
+                del self._queues[camera]
+                continue
+
+            bucket = self._bucket(queue[0].token)
+            wait = bucket.wait_time(now)
+            if wait > 0:
+                shortest_wait = wait if shortest_wait is None else min(shortest_wait, wait)
+                continue
+
+            bucket.take(now)
+            job = queue.popleft()
+            # Served camera goes to the back of the round
+            self._queues.move_to_end(camera)
+            return job, None
+        return None, shortest_wait
+
+    async def _async_dispatch(self) -> None:
+        """Start queued uploads whenever a slot and a token are free."""
+        while True:
+            self._wakeup.clear()
+            job, wait = self._next_job()
+            if job is not None:
+                self._start(job)
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def _start(self, job: _ScanJob) -> None:
+        """Run job in the background."""
+        wait_ms = (time.monotonic() - job.submitted) * 1000
+        self.last_wait_ms = round(wait_ms, 1)
+        self.max_wait_ms = max(self.max_wait_ms, self.last_wait_ms)
+        self._total_wait_ms += wait_ms
+        self._dispatched += 1
+        self._in_flight += 1
+        self.hass.async_create_task(self._async_run(job))
+
+    async def _async_run(self, job: _ScanJob) -> None:
+        """Run upload and resolve the caller's future."""
+        try:
+            result = await job.upload()
+        except RateLimitedError as err:
+            self.rate_limited += 1
+            self._bucket(job.token).pause(err.retry_after)
+            _LOGGER.warning(f"Rate limited for camera {job.camera}, retrying after {err.retry_after:.1f} s")
+            if job.attempts < MAX_RATE_LIMIT_RETRIES and not job.future.done():
+                job.attempts += 1
+                self._queues.setdefault(job.camera, deque()).appendleft(job)
+            elif not job.future.done():
+                job.future.set_exception(err)
+        except Exception as err:
+            if not job.future.done():
+                job.future.set_exception(err)
+        else:
+            self.completed += 1
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self._in_flight -= 1
+            self._wakeup.set()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return queue and wait-time metrics."""
+        return {
+            "queue_length": sum(len(queue) for queue in self._queues.values()),
+            "in_flight": self._in_flight,
+            "completed": self.completed,
+            "rate_limited": self.rate_limited,
+            "last_wait_ms": self.last_wait_ms,
+            "avg_wait_ms": round(self._total_wait_ms / self._dispatched, 1) if self._dispatched else None,
+            "max_wait_ms": round(self.max_wait_ms, 1),
+        }
+
+
+@callback
+def async_get_scheduler(
+    hass: HomeAssistant,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    rate: Optional[float] = None,
+    burst: int = 1,
+) -> ScanScheduler:
+    """Return the shared scheduler, starting it on first use."""
+    data = hass.data.setdefault(DOMAIN, {})
+    scheduler = data.get("scheduler")
+    if scheduler is None:
+        scheduler = ScanScheduler(hass, max_in_flight, rate, burst)
+        scheduler.async_start()
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, scheduler.async_stop)
+        data["scheduler"] = scheduler
+    return scheduler
@@ -10,7 +10,10 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.const import EVENT_HOMEASSISTANT_START
+from homeassistant.const import EVENT_HOMEASSISTANT_START, UnitOfTime
+from homeassistant.helpers.entity import EntityCategory
+
+from .latency import STAGE_TOTAL, async_latency_summary, timed_event_handler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,7 +53,8 @@ async def async_setup_platform(
         sensors_to_add.extend([
             LastRecognizedCarSensor(hass),
             RecognizedCarSensor(hass),
-            FormattedCarPlatesSensor(hass)
+            FormattedCarPlatesSensor(hass),
+            PlateRecognitionLatencySensor(hass)
         ])
 
         _LOGGER.info(f"Adding {len(sensors_to_add)} sensors to Home Assistant.")
@@ -158,6 +162,7 @@ class PlateRecognitionCameraSensor(SensorEntity):
         _LOGGER.info(f"Sensor {self.entity_id}: State written to HA: '{self._attr_state}'")
 
     @callback
+    @timed_event_handler("camera_sensor", "_image_processing_entity")
     def _handle_image_processed(self, event: Any) -> None:
         """Handle event after image processing by corresponding camera."""
         event_entity_id = event.data.get('entity_id')
@@ -449,6 +454,7 @@ class LastRecognizedCarSensor(RestoreEntity, SensorEntity):
         _LOGGER.info(f"Sensor {self.entity_id}: initialization completed")
 
     @callback
+    @timed_event_handler("last_recognized_car")
     def _handle_image_processed(self, event):
         """Handle image processing event."""
         _LOGGER.info(f"Sensor {self.entity_id}: received event, has_vehicles: {event.data.get('has_vehicles')}")
@@ -573,6 +579,7 @@ class RecognizedCarSensor(SensorEntity):
         _LOGGER.info(f"Sensor {self._attr_unique_id}: registered event listening")
 
     @callback
+    @timed_event_handler("recognized_car")
     def _handle_image_processed(self, event):
         """Handle image processing event."""
         _LOGGER.info(f"Sensor {self._attr_unique_id}: received event, has_vehicles: {event.data.get('has_vehicles')}")
@@ -582,7 +589,8 @@ class RecognizedCarSensor(SensorEntity):
             return
 
         vehicles = event.data.get('vehicles', [])
-        plates = [v.get('plate').upper() for v in vehicles if v.get('plate') is not None]
+        # Prefer the candidate reading that matched the registry over the top reading
+        plates = [(v.get('candidate') or v.get('plate')).upper() for v in vehicles if v.get('plate') is not None]
 
         if not plates:
             _LOGGER.debug(f"Sensor {self._attr_unique_id}: no plates, ignoring")
@@ -599,14 +607,12 @@ class RecognizedCarSensor(SensorEntity):
         if self._clear_task and not self._clear_task.done():
             self._clear_task.cancel()
 
-        recognized = [p for p in plates if plate_manager.is_plate_known(p)]
+        # One registry lookup per plate gives corrected plate and owner together
+        matches = [plate_manager.match(p) for p in plates]
+        recognized = [m for m in matches if m.known]
         if recognized:
-            # Get owners for all recognized plates – CHANGE: Use corrected plate from plates.yaml
-            owners_info = []
-            for plate in recognized:
-                corrected_plate = plate_manager.get_corrected_plate(plate)  # Get version from plates.yaml (with tolerate_one_mistake)
-                owner = plate_manager.get_plate_owner(corrected_plate)  # Get owner based on corrected plate
-                owners_info.append(f"{corrected_plate} ({owner})")  # CHANGE: Use corrected_plate instead of original plate
+            # Use corrected plate from plates.yaml (with tolerate_one_mistake)
+            owners_info = [f"{m.plate} ({m.owner})" for m in recognized]
 
             self._attr_state = self._get_translation('state.sensor.recognized_car.recognized', plates=', '.join(owners_info))
             _LOGGER.info(f"Sensor {self._attr_unique_id}: recognized plates: {self._attr_state}")
@@ -639,3 +645,30 @@ class RecognizedCarSensor(SensorEntity):
     def should_poll(self):
         """No polling needed."""
         return False
+
+
+class PlateRecognitionLatencySensor(SensorEntity):
+    """Diagnostic sensor with per-stage scan latency percentiles of every camera."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize sensor."""
+        self.hass = hass
+        self._attr_name = "Plate Recognition Latency"
+        self._attr_unique_id = "enhanced_platerecognizer_latency"
+        self._attr_native_value = None
+        self._attr_extra_state_attributes = {}
+
+    async def async_update(self) -> None:
+        """Refresh percentiles, state is the slowest camera's p95 scan time."""
+        summary = async_latency_summary(self.hass)
+        totals = [stages[STAGE_TOTAL]["p95"] for stages in summary.values() if stages.get(STAGE_TOTAL)]
+        self._attr_native_value = max(totals) if totals else None
+        self._attr_extra_state_attributes = summary
+
+    @property
+    def should_poll(self):
+        """Poll, percentiles are computed on demand."""
+        return True
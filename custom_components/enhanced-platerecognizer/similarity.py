@@ -0,0 +1,218 @@
+"""Confusion-aware weighted similarity between plates."""
+
+import logging
+import math
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+CONF_SIMILARITY = "similarity"
+CONF_SUBSTITUTION_COSTS = "substitution_costs"
+CONF_SUBSTITUTION_COST = "substitution_cost"
+CONF_INSERT_DELETE_COST = "insert_delete_cost"
+CONF_MAX_MATCH_COST = "max_match_cost"
+
+SIMILARITY_HAMMING = "hamming"
+SIMILARITY_WEIGHTED = "weighted"
+
+# Common OCR confusions, cheaper than any other substitution
+DEFAULT_SUBSTITUTION_COSTS = {"O0": 0.2, "I1": 0.2, "B8": 0.3, "S5": 0.3, "Z2": 0.3}
+DEFAULT_SUBSTITUTION_COST = 1.0
+DEFAULT_MAX_MATCH_COST = 1.0
+
+# Deletion neighbourhoods grow combinatorially, so full-cost edits are capped
+MAX_FULL_COST_EDITS = 2
+
+# Costs are compared after rounding so float sums of equal edits tie
+COST_DIGITS = 6
+COST_EPSILON = 1e-9
+
+
+def _parse_pair(pair: Any) -> Tuple[str, str]:
+    """Return the two characters of a pair written as 'O0' or 'O/0'."""
+    chars = str(pair).upper().replace("/", "")
+    if len(chars) != 2 or chars[0] == chars[1]:
+        raise ValueError(f"Invalid substitution pair '{pair}', expected two different characters like 'O0'")
+    return chars[0], chars[1]
+
+
+class CostModel:
+    """Edit costs between plate characters.
+
+    Pairs cheaper than the default substitution cost are merged into
+    confusion classes. Plates equal up to in-class substitutions share a
+    canonical form, which is what the index is built on.
+    """
+
+    def __init__(
+        self,
+        substitution_costs: Dict[Any, float],
+        substitution_cost: float = DEFAULT_SUBSTITUTION_COST,
+        insert_delete_cost: Optional[float] = None,
+    ):
+        """Initialize cost model."""
+        self.substitution_cost = float(substitution_cost)
+        self.insert_delete_cost = None if insert_delete_cost is None else float(insert_delete_cost)
+        self._pairs: Dict[Tuple[str, str], float] = {}
+        parent: Dict[str, str] = {}
+
+        def find(char: str) -> str:
+            while parent.get(char, char) != char:
+                char = parent[char]
+            return char
+
+        for pair, cost in substitution_costs.items():
+            first, second = _parse_pair(pair)
+            cost = float(cost)
+            if cost < 0:
+                raise ValueError(f"Substitution cost of '{pair}' must not be negative")
+            # Later entries override earlier ones written in either order
+            self._pairs[first, second] = self._pairs[second, first] = cost
+
+        for (first, second), cost in self._pairs.items():
+            if cost < self.substitution_cost:
+                parent[find(first)] = find(second)
+
+        self._canonical = {char: find(char) for char in parent}
+
+    @property
+    def full_cost(self) -> float:
+        """Return the cheapest edit not covered by confusion classes."""
+        costs = [self.substitution_cost]
+        if self.insert_delete_cost is not None:
+            costs.append(self.insert_delete_cost)
+        return min(costs)
+
+    def canonical(self, plate: str) -> str:
+        """Return plate with every character replaced by its confusion class."""
+        return "".join(self._canonical.get(char, char) for char in plate)
+
+    def substitution(self, first: str, second: str) -> float:
+        """Return cost of reading first as second."""
+        if first == second:
+            return 0.0
+        return self._pairs.get((first, second), self.substitution_cost)
+
+    def distance(self, plate1: str, plate2: str, limit: float = math.inf) -> float:
+        """Return weighted edit cost between upper-case plates, or inf above limit."""
+        indel = self.insert_delete_cost
+        if indel is None:
+            if len(plate1) != len(plate2):
+                return math.inf
+            cost = 0.0
+            for first, second in zip(plate1, plate2):
+                cost += self.substitution(first, second)
+                if cost > limit:
+                    return math.inf
+            return cost
+
+        previous = [index * indel for index in range(len(plate2) + 1)]
+        for row, first in enumerate(plate1, start=1):
+            current = [row * indel]
+            for column, second in enumerate(plate2, start=1):
+                current.append(min(
+                    previous[column] + indel,
+                    current[column - 1] + indel,
+                    previous[column - 1] + self.substitution(first, second),
+                ))
+            if min(current) > limit:
+                return math.inf
+            previous = current
+        return previous[-1] if previous[-1] <= limit else math.inf
+
+
+def _deletions(plate: str, edits: int) -> Set[str]:
+    """Return plate with every combination of up to edits characters deleted."""
+    variants = {plate}
+    level = variants
+    for _ in range(edits):
+        level = {variant[:index] + variant[index + 1:] for variant in level for index in range(len(variant))}
+        variants |= level
+    return variants
+
+
+class WeightedIndex:
+    """Deletion neighbourhood index over canonical plates.
+
+    Two plates within max_cost differ by at most max_cost / full_cost edits
+    outside their confusion classes, so their canonical forms share a
+    variant with that many characters deleted. Candidates found this way are
+    verified with the exact weighted edit cost.
+    """
+
+    def __init__(self, model: CostModel, max_cost: float = DEFAULT_MAX_MATCH_COST):
+        """Initialize index."""
+        self.model = model
+        self.max_cost = float(max_cost)
+        edits = int(math.floor(self.max_cost / model.full_cost + COST_EPSILON)) if model.full_cost > 0 else MAX_FULL_COST_EDITS
+        if edits > MAX_FULL_COST_EDITS:
+            _LOGGER.warning(
+                f"max_match_cost {self.max_cost} allows {edits} full-cost edits; "
+                f"matching is limited to {MAX_FULL_COST_EDITS}"
+            )
+            edits = MAX_FULL_COST_EDITS
+        self.edits = edits
+        self._variants: Dict[str, List[Any]] = {}
+
+    def rebuild(self, plates: Iterable[Any]) -> None:
+        """Rebuild the index from registry plates."""
+        variants: Dict[str, List[Any]] = {}
+        for plate in plates:
+            for variant in _deletions(self.model.canonical(str(plate).upper()), self.edits):
+                variants.setdefault(variant, []).append(plate)
+        self._variants = variants
+
+    def add(self, plate: Any) -> None:
+        """Index one registry plate in place."""
+        for variant in _deletions(self.model.canonical(str(plate).upper()), self.edits):
+            bucket = self._variants.setdefault(variant, [])
+            if plate not in bucket:
+                bucket.append(plate)
+
+    def remove(self, plate: Any) -> None:
+        """Drop one registry plate from the index."""
+        for variant in _deletions(self.model.canonical(str(plate).upper()), self.edits):
+            bucket = self._variants.get(variant)
+            if bucket and plate in bucket:
+                bucket.remove(plate)
+                if not bucket:
+                    del self._variants[variant]
+
+    def within(self, plate1: str, plate2: str) -> bool:
+        """Return True if plates are within max_cost of each other."""
+        limit = self.max_cost + COST_EPSILON
+        return self.model.distance(plate1.upper(), plate2.upper(), limit) <= limit
+
+    def ranked(self, plate: str) -> List[Tuple[float, str, Any]]:
+        """Return (cost, name, plate) of registry plates within max_cost, best first."""
+        query = plate.upper()
+        candidates = set()
+        for variant in _deletions(self.model.canonical(query), self.edits):
+            candidates.update(self._variants.get(variant, ()))
+
+        ranked = []
+        limit = self.max_cost + COST_EPSILON
+        for known in candidates:
+            cost = self.model.distance(query, str(known).upper(), limit)
+            if cost <= limit:
+                ranked.append((round(cost, COST_DIGITS), str(known), known))
+        ranked.sort(key=lambda item: item[:2])
+        return ranked
+
+
+def weighted_index_from_config(config: Dict[str, Any]) -> Optional[WeightedIndex]:
+    """Return a weighted index if the domain config enables it, else None."""
+    mode = config.get(CONF_SIMILARITY, SIMILARITY_HAMMING)
+    if mode == SIMILARITY_HAMMING:
+        return None
+    if mode != SIMILARITY_WEIGHTED:
+        raise ValueError(f"Unknown similarity '{mode}', expected '{SIMILARITY_HAMMING}' or '{SIMILARITY_WEIGHTED}'")
+
+    costs = dict(DEFAULT_SUBSTITUTION_COSTS)
+    costs.update(config.get(CONF_SUBSTITUTION_COSTS) or {})
+    model = CostModel(
+        costs,
+        config.get(CONF_SUBSTITUTION_COST, DEFAULT_SUBSTITUTION_COST),
+        config.get(CONF_INSERT_DELETE_COST),
+    )
+    return WeightedIndex(model, config.get(CONF_MAX_MATCH_COST, DEFAULT_MAX_MATCH_COST))
@@ -0,0 +1,190 @@
+"""Background annotation and saving of detection snapshots."""
+
+import asyncio
+import io
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple
+
+from PIL import Image, ImageDraw
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.pil import draw_box
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "enhanced_platerecognizer"
+
+RED = (255, 0, 0)  # For objects within the ROI
+
+SNAPSHOT_FORMATS = {"png": "PNG", "jpeg": "JPEG", "webp": "WEBP"}
+SNAPSHOT_EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
+POLICY_DROP_OLDEST = "drop_oldest"
+POLICY_BLOCK = "block"
+
+DEFAULT_SNAPSHOT_FORMAT = "png"
+DEFAULT_SNAPSHOT_QUALITY = 85
+DEFAULT_SNAPSHOT_QUEUE_SIZE = 8
+DEFAULT_SNAPSHOT_QUEUE_POLICY = POLICY_DROP_OLDEST
+SNAPSHOT_WORKERS = 2
+
+
+class SnapshotJob(NamedTuple):
+    """Frame with results to annotate and write to one or more paths."""
+
+    image: Any
+    results: List[Dict]
+    width: int
+    height: int
+    paths: List[Path]
+
+
+def annotate_and_encode(job: SnapshotJob, image_format: str, quality: int) -> bytes:
+    """Draw result boxes on the frame and encode it once."""
+    decimal_places = 3
+    with Image.open(io.BytesIO(job.image)) as frame:
+        if image_format != "png" and frame.mode not in ("RGB", "L"):
+            frame = frame.convert("RGB")
+        draw = ImageDraw.Draw(frame)
+
+        for vehicle in job.results:
+            box = (
+                round(vehicle['box']["ymin"] / job.height, decimal_places),
+                round(vehicle['box']["xmin"] / job.width, decimal_places),
+                round(vehicle['box']["ymax"] / job.height, decimal_places),
+                round(vehicle['box']["xmax"] / job.width, decimal_places),
+            )
+            draw_box(
+                draw,
+                box,
+                job.width,
+                job.height,
+                text=vehicle.get('plate', ''),
+                color=RED,
+            )
+
+        buffer = io.BytesIO()
+        if image_format == "png":
+            frame.save(buffer, format="PNG")
+        else:
+            frame.save(buffer, format=SNAPSHOT_FORMATS[image_format], quality=quality)
+    return buffer.getvalue()
+
+
+def write_outputs(data: bytes, paths: List[Path]) -> None:
+    """Write encoded snapshot to every path."""
+    for path in paths:
+        path.write_bytes(data)
+
+
+class SnapshotWriter:
+    """Bounded queue of snapshots encoded and written by background workers."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_format: str = DEFAULT_SNAPSHOT_FORMAT,
+        quality: int = DEFAULT_SNAPSHOT_QUALITY,
+        queue_size: int = DEFAULT_SNAPSHOT_QUEUE_SIZE,
+        policy: str = DEFAULT_SNAPSHOT_QUEUE_POLICY,
+    ):
+        """Initialize writer."""
+        self.hass = hass
+        self.image_format = image_format
+        self._quality = quality
+        self._policy = policy
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._workers: List[asyncio.Task] = []
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_encode_ms = None
+        self._total_encode_ms = 0.0
+
+    @property
+    def extension(self) -> str:
+        """Return file extension for the configured format."""
+        return SNAPSHOT_EXTENSIONS[self.image_format]
+
+    @callback
+    def async_start(self) -> None:
+        """Start worker tasks."""
+        for number in range(SNAPSHOT_WORKERS):
+            self._workers.append(
+                self.hass.async_create_background_task(
+                    self._async_worker(), f"{DOMAIN} snapshot writer {number}"
+                )
+            )
+
+    @callback
+    def async_stop(self, event=None) -> None:
+        """Stop worker tasks."""
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+
+    async def async_submit(self, job: SnapshotJob) -> None:
+        """Queue job, dropping the oldest job or waiting when the queue is full."""
+        if self._policy == POLICY_DROP_OLDEST:
+            while self._queue.full():
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped += 1
+                _LOGGER.warning("Snapshot queue full, dropped oldest snapshot")
+            self._queue.put_nowait(job)
+        else:
+            await self._queue.put(job)
+
+    async def _async_worker(self) -> None:
+        """Encode and write queued snapshots."""
+        while True:
+            job = await self._queue.get()
+            try:
+                start = time.perf_counter()
+                data = await self.hass.async_add_executor_job(
+                    annotate_and_encode, job, self.image_format, self._quality
+                )
+                self.last_encode_ms = round((time.perf_counter() - start) * 1000, 1)
+                self._total_encode_ms += self.last_encode_ms
+                await self.hass.async_add_executor_job(write_outputs, data, job.paths)
+                self.written += 1
+                _LOGGER.info("platerecognizer saved file(s) %s", [str(path) for path in job.paths])
+            except Exception as exc:
+                self.failed += 1
+                _LOGGER.error("Error saving snapshot: %s", exc)
+            finally:
+                self._queue.task_done()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return queue and encode metrics."""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "last_encode_ms": self.last_encode_ms,
+            "avg_encode_ms": round(self._total_encode_ms / self.written, 1) if self.written else None,
+        }
+
+
+@callback
+def async_get_snapshot_writer(
+    hass: HomeAssistant,
+    image_format: str = DEFAULT_SNAPSHOT_FORMAT,
+    quality: int = DEFAULT_SNAPSHOT_QUALITY,
+    queue_size: int = DEFAULT_SNAPSHOT_QUEUE_SIZE,
+    policy: str = DEFAULT_SNAPSHOT_QUEUE_POLICY,
+) -> SnapshotWriter:
+    """Return the shared snapshot writer, starting it on first use."""
+    data = hass.data.setdefault(DOMAIN, {})
+    writer = data.get("snapshot_writer")
+    if writer is None:
+        writer = SnapshotWriter(hass, image_format, quality, queue_size, policy)
+        writer.async_start()
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, writer.async_stop)
+        data["snapshot_writer"] = writer
+    return writer